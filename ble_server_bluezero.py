@@ -374,6 +374,7 @@ class GatetorioBLEServer:
 
         # Set engineer command flag
         self.controller.shared[f'engineer_{key}'] = True
+        self.controller.wake_motor()
         return {"success": True, "message": f"Engineer command sent: {key}"}
 
     def _handle_get_config(self) -> Dict:
@@ -450,6 +451,7 @@ class GatetorioBLEServer:
         try:
             self.config.engineer_mode_enabled = enabled
             self.controller.shared['engineer_mode_enabled'] = enabled
+            self.controller.wake_motor()
             status = "enabled" if enabled else "disabled"
             print(f"[BLE] Engineer mode {status}")
             return {"success": True, "message": f"Engineer mode {status}"}
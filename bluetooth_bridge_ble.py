@@ -366,6 +366,7 @@ class GatetorioBLEBridge:
 
         # Set engineer command flag in shared dict
         self.controller.shared[f'engineer_{key}'] = True
+        self.controller.wake_motor()
 
         return {"success": True, "message": f"Engineer command sent: {key}"}
 
@@ -463,6 +464,7 @@ class GatetorioBLEBridge:
         """Enable/disable engineer mode"""
         self.config.engineer_mode_enabled = enabled
         self.controller.shared['engineer_mode_enabled'] = enabled
+        self.controller.wake_motor()
         return {
             "success": True,
             "message": f"Engineer mode {'enabled' if enabled else 'disabled'}"
@@ -4,13 +4,16 @@ Gate Controller V2 - Multiprocessing architecture
 Step 3: Added input manager process
 """
 
-from time import time, sleep
+from time import time, sleep, monotonic
 import json
 import threading
 import multiprocessing
-from motor_manager import motor_manager_process
+from motor_manager import motor_manager_process, MotorTelemetry
 from input_manager import input_manager_process  # Safe now - no GPIO claim at import
 
+# Live get_status() results are reused for this long (seconds)
+STATUS_CACHE_TTL = 0.1
+
 class GateController:
     def __init__(self, config_file='/home/doowkcol/Gatetorio_Code/gate_config.json'):
         # Load config
@@ -76,6 +79,12 @@ class GateController:
         self.learning_speed = config.get('learning_speed', 0.3)
         self.open_speed = config.get('open_speed', 1.0)  # User-configurable open speed (0.1-1.0)
         self.close_speed = config.get('close_speed', 1.0)  # User-configurable close speed (0.1-1.0)
+        # Motor process real-time scheduling (see motor_manager_process)
+        self.motor_rt_priority = config.get('motor_rt_priority', 0)  # Opt-in SCHED_FIFO priority (e.g. 50), 0 = normal scheduling
+        self.motor_cpu = config.get('motor_cpu', None)  # CPU to pin motor process to (e.g. 3 with isolcpus=3)
+        self.motor_mlock = config.get('motor_mlock', False)  # Opt-in mlockall() - un-shares the forked heap, roughly doubling RSS
+        self.motor_direct_pwm = config.get('motor_direct_pwm', True)  # Speed-only changes write the PWM pin directly
+        self.motor_debug = config.get('motor_debug', False)  # Per-tick diagnostic prints in the motor loop
         # Engineer mode is runtime-only, never persisted - always starts disabled
         self.engineer_mode_enabled = False
 
@@ -87,51 +96,35 @@ class GateController:
         self._init_shared_state()
 
         # Write initial config values to shared memory (for UI and motor_manager reload)
-        self.shared['config_motor1_run_time'] = self.motor1_run_time
-        self.shared['config_motor2_run_time'] = self.motor2_run_time
-        self.shared['config_motor2_enabled'] = self.motor2_enabled
-        self.shared['config_motor1_open_delay'] = self.motor1_open_delay
-        self.shared['config_motor2_close_delay'] = self.motor2_close_delay
-        self.shared['config_partial_1_position'] = self.partial_1_position
-        self.shared['config_partial_2_position'] = self.partial_2_position
-        self.shared['config_deadman_speed'] = self.deadman_speed
-        self.shared['config_limit_switches_enabled'] = self.limit_switches_enabled
-        self.shared['config_motor1_use_limit_switches'] = self.motor1_use_limit_switches
-        self.shared['config_motor2_use_limit_switches'] = self.motor2_use_limit_switches
-        self.shared['config_limit_switch_creep_speed'] = self.limit_switch_creep_speed
-        self.shared['config_opening_slowdown_percent'] = self.opening_slowdown_percent
-        self.shared['config_closing_slowdown_percent'] = self.closing_slowdown_percent
-        self.shared['config_slowdown_distance'] = self.slowdown_distance
-        self.shared['config_learning_speed'] = self.learning_speed
-        self.shared['config_open_speed'] = self.open_speed
-        self.shared['config_close_speed'] = self.close_speed
+        self._config_version = 0
+        self._publish_motor_config()
 
         # Prepare config for motor manager
-        motor_config = {
-            'motor1_run_time': self.motor1_run_time,
-            'motor2_run_time': self.motor2_run_time,
-            'motor2_enabled': self.motor2_enabled,
-            'motor1_open_delay': self.motor1_open_delay,
-            'motor2_close_delay': self.motor2_close_delay,
-            'partial_1_position': self.partial_1_position,
-            'partial_2_position': self.partial_2_position,
-            'deadman_speed': self.deadman_speed,
-            'limit_switches_enabled': self.limit_switches_enabled,
-            'motor1_use_limit_switches': self.motor1_use_limit_switches,
-            'motor2_use_limit_switches': self.motor2_use_limit_switches,
-            'limit_switch_creep_speed': self.limit_switch_creep_speed,
-            'opening_slowdown_percent': self.opening_slowdown_percent,
-            'closing_slowdown_percent': self.closing_slowdown_percent,
-            'slowdown_distance': self.slowdown_distance,
-            'learning_speed': self.learning_speed,
-            'open_speed': self.open_speed,
-            'close_speed': self.close_speed
-        }
-        
-        # Start motor manager process
+        motor_config = self._motor_config_values()
+        motor_config.update({
+            'motor_rt_priority': self.motor_rt_priority,
+            'motor_cpu': self.motor_cpu,
+            'motor_mlock': self.motor_mlock,
+            'motor_direct_pwm': self.motor_direct_pwm,
+            'motor_debug': self.motor_debug
+        })
+        
+        # Serializes read-flip-write of shared flags between threads of this
+        # process only (Tk, web, BLE) - the input/motor processes write the
+        # Manager dict without it
+        self._toggle_lock = threading.Lock()
+        # (monotonic time, status) from the last live get_status() - the Tk
+        # and BLE pollers share one build per STATUS_CACHE_TTL
+        self._status_cache = (-STATUS_CACHE_TTL, None)
+
+        # Start motor manager process - motor_wake lets it block while idle
+        # instead of polling; set it whenever motion is requested
+        self.motor_wake = multiprocessing.Event()
+        # Locked shared-memory mirror of positions/speeds, read by get_status() without IPC
+        self.motor_telemetry = MotorTelemetry()
         self.motor_process = multiprocessing.Process(
             target=motor_manager_process,
-            args=(self.shared, motor_config),
+            args=(self.shared, motor_config, self.motor_wake, self.motor_telemetry),
             daemon=True
         )
         self.motor_process.start()
@@ -145,7 +138,7 @@ class GateController:
         # Start input manager process
         self.input_process = multiprocessing.Process(
             target=input_manager_process,
-            args=(self.shared, input_config),
+            args=(self.shared, input_config, self.motor_wake),
             daemon=True
         )
         self.input_process.start()
@@ -165,6 +158,41 @@ class GateController:
         sleep(0.5)
         self._detect_initial_position()
     
+    def _motor_config_values(self):
+        """Config values the motor manager runs on, keyed by attribute name"""
+        return {
+            'motor1_run_time': self.motor1_run_time,
+            'motor2_run_time': self.motor2_run_time,
+            'motor2_enabled': self.motor2_enabled,
+            'motor1_open_delay': self.motor1_open_delay,
+            'motor2_close_delay': self.motor2_close_delay,
+            'partial_1_position': self.partial_1_position,
+            'partial_2_position': self.partial_2_position,
+            'deadman_speed': self.deadman_speed,
+            'limit_switches_enabled': self.limit_switches_enabled,
+            'motor1_use_limit_switches': self.motor1_use_limit_switches,
+            'motor2_use_limit_switches': self.motor2_use_limit_switches,
+            'limit_switch_creep_speed': self.limit_switch_creep_speed,
+            'opening_slowdown_percent': self.opening_slowdown_percent,
+            'closing_slowdown_percent': self.closing_slowdown_percent,
+            'slowdown_distance': self.slowdown_distance,
+            'learning_speed': self.learning_speed,
+            'open_speed': self.open_speed,
+            'close_speed': self.close_speed,
+        }
+
+    def _publish_motor_config(self, reload=False):
+        """Write motor config to shared memory in a single round trip.
+        With reload=True also publishes a versioned config_snapshot - the motor
+        manager applies it as one unit when it sees a new version."""
+        values = self._motor_config_values()
+        update = {'config_' + key: value for key, value in values.items()}
+        if reload:
+            self._config_version += 1
+            values['version'] = self._config_version
+            update['config_snapshot'] = values
+        self.shared.update(update)
+
     def reload_config(self, config_file='/home/doowkcol/Gatetorio_Code/gate_config.json'):
         """Reload configuration from file - updates runtime parameters
 
@@ -212,26 +240,8 @@ class GateController:
             # Engineer mode is runtime-only, don't change it during reload
             # self.engineer_mode_enabled - keep current runtime value
 
-            # Update motor manager config via shared memory
-            self.shared['config_motor1_run_time'] = self.motor1_run_time
-            self.shared['config_motor2_run_time'] = self.motor2_run_time
-            self.shared['config_motor2_enabled'] = self.motor2_enabled
-            self.shared['config_motor1_open_delay'] = self.motor1_open_delay
-            self.shared['config_motor2_close_delay'] = self.motor2_close_delay
-            self.shared['config_partial_1_position'] = self.partial_1_position
-            self.shared['config_partial_2_position'] = self.partial_2_position
-            self.shared['config_deadman_speed'] = self.deadman_speed
-            self.shared['config_limit_switches_enabled'] = self.limit_switches_enabled
-            self.shared['config_motor1_use_limit_switches'] = self.motor1_use_limit_switches
-            self.shared['config_motor2_use_limit_switches'] = self.motor2_use_limit_switches
-            self.shared['config_limit_switch_creep_speed'] = self.limit_switch_creep_speed
-            self.shared['config_opening_slowdown_percent'] = self.opening_slowdown_percent
-            self.shared['config_closing_slowdown_percent'] = self.closing_slowdown_percent
-            self.shared['config_slowdown_distance'] = self.slowdown_distance
-            self.shared['config_learning_speed'] = self.learning_speed
-            self.shared['config_open_speed'] = self.open_speed
-            self.shared['config_close_speed'] = self.close_speed
-            self.shared['config_reload_flag'] = True  # Signal motor manager to reload
+            # Update motor manager config via shared memory (signals it to reload)
+            self._publish_motor_config(reload=True)
 
             print(f"  Config reloaded successfully")
             print(f"  M1 run time: {self.motor1_run_time}s, M2 run time: {self.motor2_run_time}s")
@@ -1182,6 +1192,7 @@ class GateController:
         # Start fresh open operation
         self.shared['state'] = 'OPENING'
         self.shared['movement_start_time'] = time()
+        self.wake_motor()
         self.shared['movement_command'] = 'OPEN'
         self.shared['resume_time'] = None
         self.shared['stopped_after_opening'] = False
@@ -1209,6 +1220,7 @@ class GateController:
         # Start movement
         self.shared['state'] = 'CLOSING'
         self.shared['movement_start_time'] = time()
+        self.wake_motor()
         self.shared['movement_command'] = 'CLOSE'
         self.shared['resume_time'] = None
         self.shared['stopped_after_closing'] = False
@@ -1675,6 +1687,7 @@ class GateController:
         # Start movement
         self.shared['state'] = 'OPENING'
         self.shared['movement_start_time'] = time()
+        self.wake_motor()
         self.shared['movement_command'] = 'OPEN'
         self.shared['resume_time'] = None  # Clear resume flag
         
@@ -1729,6 +1742,7 @@ class GateController:
         # Start movement
         self.shared['state'] = 'CLOSING'
         self.shared['movement_start_time'] = time()
+        self.wake_motor()
         self.shared['movement_command'] = 'CLOSE'
         self.shared['resume_time'] = None  # Clear resume flag
         
@@ -1801,6 +1815,21 @@ class GateController:
         else:
             print("STOP CLOSING edge CLEARED")
     
+    def wake_motor(self):
+        """Wake the motor manager from its idle wait - call after requesting motion"""
+        self.motor_wake.set()
+
+    def toggle_flag(self, key):
+        """Flip a boolean shared flag and return its new value. Atomic only
+        against other callers in this process, not the input/motor processes"""
+        with self._toggle_lock:
+            value = not self.shared.get(key, False)
+            self.shared[key] = value
+        # Deadman/engineer flags drive the motors directly - don't leave the
+        # motor loop in its idle wait
+        self.wake_motor()
+        return value
+
     def cmd_safety_stop_opening(self, active):
         """Set stop opening safety edge state"""
         self.shared['safety_stop_opening_active'] = active
@@ -1812,6 +1841,7 @@ class GateController:
     def cmd_deadman_open(self, active):
         """Set deadman open control"""
         self.shared['deadman_open_active'] = active
+        self.wake_motor()
         if active:
             print(f"DEADMAN OPEN active - {self.deadman_speed*100:.0f}% speed")
         else:
@@ -1820,6 +1850,7 @@ class GateController:
     def cmd_deadman_close(self, active):
         """Set deadman close control"""
         self.shared['deadman_close_active'] = active
+        self.wake_motor()
         if active:
             print(f"DEADMAN CLOSE active - {self.deadman_speed*100:.0f}% speed")
         else:
@@ -1905,6 +1936,7 @@ class GateController:
 
             self.shared['state'] = 'CLOSING_TO_PARTIAL_1'
             self.shared['movement_start_time'] = time()
+            self.wake_motor()
             self.shared['movement_command'] = 'CLOSE'
             self.shared['m1_move_start'] = time()
             self.shared['m1_target'] = self.shared['m1_position']
@@ -1919,6 +1951,7 @@ class GateController:
             print(f"Opening to PARTIAL_1 ({self.partial_1_percent}%) - M1 position START={self.shared['m1_position']:.2f}s TARGET={self.partial_1_position:.2f}s")
             self.shared['state'] = 'OPENING_TO_PARTIAL_1'
             self.shared['movement_start_time'] = time()
+            self.wake_motor()
             self.shared['movement_command'] = 'OPEN'
             self.shared['m1_move_start'] = time()
             self.shared['m1_target'] = self.shared['m1_position']
@@ -1938,6 +1971,7 @@ class GateController:
 
             self.shared['state'] = 'CLOSING_TO_PARTIAL_2'
             self.shared['movement_start_time'] = time()
+            self.wake_motor()
             self.shared['movement_command'] = 'CLOSE'
             self.shared['m1_move_start'] = time()
             self.shared['m1_target'] = self.shared['m1_position']
@@ -1952,6 +1986,7 @@ class GateController:
             print(f"Opening to PARTIAL_2 ({self.partial_2_percent}%)")
             self.shared['state'] = 'OPENING_TO_PARTIAL_2'
             self.shared['movement_start_time'] = time()
+            self.wake_motor()
             self.shared['movement_command'] = 'OPEN'
             self.shared['m1_move_start'] = time()
             self.shared['m1_target'] = self.shared['m1_position']
@@ -1964,6 +1999,7 @@ class GateController:
         print(f"Closing from OPEN to PARTIAL_1 ({self.partial_1_percent}%) - M1 position START={self.shared['m1_position']:.2f}s TARGET={self.partial_1_position:.2f}s")
         self.shared['state'] = 'CLOSING_TO_PARTIAL_1'
         self.shared['movement_start_time'] = time()
+        self.wake_motor()
         self.shared['movement_command'] = 'CLOSE'
         self.shared['returning_from_full_open'] = True
         self.shared['closing_from_partial'] = 'P1'
@@ -1986,6 +2022,7 @@ class GateController:
         print(f"Closing from OPEN to PARTIAL_2 ({self.partial_2_percent}%)")
         self.shared['state'] = 'CLOSING_TO_PARTIAL_2'
         self.shared['movement_start_time'] = time()
+        self.wake_motor()
         self.shared['movement_command'] = 'CLOSE'
         self.shared['returning_from_full_open'] = True
         self.shared['closing_from_partial'] = 'P2'
@@ -2099,6 +2136,7 @@ class GateController:
             return
 
         self.shared['engineer_motor1_open'] = active
+        self.wake_motor()
         if active:
             print("[ENGINEER] Motor 1 OPENING (hold-to-run)")
         else:
@@ -2116,6 +2154,7 @@ class GateController:
             return
 
         self.shared['engineer_motor1_close'] = active
+        self.wake_motor()
         if active:
             print("[ENGINEER] Motor 1 CLOSING (hold-to-run)")
         else:
@@ -2137,6 +2176,7 @@ class GateController:
             return
 
         self.shared['engineer_motor2_open'] = active
+        self.wake_motor()
         if active:
             print("[ENGINEER] Motor 2 OPENING (hold-to-run)")
         else:
@@ -2158,6 +2198,7 @@ class GateController:
             return
 
         self.shared['engineer_motor2_close'] = active
+        self.wake_motor()
         if active:
             print("[ENGINEER] Motor 2 CLOSING (hold-to-run)")
         else:
@@ -2170,6 +2211,7 @@ class GateController:
         """
         self.engineer_mode_enabled = True
         self.shared['engineer_mode_enabled'] = True
+        self.wake_motor()
         print("=" * 60)
         print("⚠️  ENGINEER MODE ENABLED ⚠️")
         print("Direct motor controls are now available.")
@@ -2185,6 +2227,7 @@ class GateController:
         self.shared['engineer_motor1_close'] = False
         self.shared['engineer_motor2_open'] = False
         self.shared['engineer_motor2_close'] = False
+        self.wake_motor()
         print("Engineer mode DISABLED - direct motor controls locked")
 
     # ========================================================================
@@ -2327,6 +2370,7 @@ class GateController:
         # Signal motor_manager to start auto-learn
         # Motor manager will handle the entire sequence
         self.shared['auto_learn_active'] = True
+        self.wake_motor()
         self.shared['auto_learn_status_msg'] = 'Starting auto-learn sequence...'
 
         print("=== AUTO-LEARN STARTED ===")
@@ -2356,37 +2400,62 @@ class GateController:
             'm2_times': list(self.shared.get('auto_learn_m2_times', []))
         }
 
-    def get_status(self):
-        """Get current status"""
+    def get_status(self, snap=None):
+        """Get current status - pass a shared.copy() snapshot to read it
+        locally instead of one proxy round trip per field"""
+        if snap is None:
+            now = monotonic()
+            cached_at, status = self._status_cache
+            if now - cached_at >= STATUS_CACHE_TTL:
+                status = self._build_status(self.shared)
+                self._status_cache = (now, status)
+            # Callers may annotate the dict - hand each its own copy
+            return dict(status)
+        return self._build_status(snap)
+
+    def _build_status(self, shared):
+        """Status dict from shared (the live proxy or a snapshot of it)"""
+        # Positions/speeds from the motor telemetry slot while moving (one
+        # consistent sample, no IPC), else from shared memory
+        telemetry = self.motor_telemetry.read()
+        if telemetry is not None:
+            m1_position, m2_position, m1_speed, m2_speed = telemetry
+        else:
+            m1_position = shared['m1_position']
+            m2_position = shared['m2_position']
+            m1_speed = shared['m1_speed']
+            m2_speed = shared['m2_speed']
+
         # Calculate percentage for each motor based on its own run time
-        m1_percent = (self.shared['m1_position'] / self.motor1_run_time) * 100 if self.motor1_run_time > 0 else 0
-        m2_percent = (self.shared['m2_position'] / self.motor2_run_time) * 100 if self.motor2_run_time > 0 else 0
+        m1_percent = (m1_position / self.motor1_run_time) * 100 if self.motor1_run_time > 0 else 0
+        m2_percent = (m2_position / self.motor2_run_time) * 100 if self.motor2_run_time > 0 else 0
         avg_percent = (m1_percent + m2_percent) / 2
-        avg_pos = (self.shared['m1_position'] + self.shared['m2_position']) / 2
+        avg_pos = (m1_position + m2_position) / 2
 
         return {
-            'state': self.shared['state'],
+            'state': shared['state'],
             'position': avg_pos,
             'motor1_run_time': self.motor1_run_time,
             'motor2_run_time': self.motor2_run_time,
             'position_percent': avg_percent,
             'm1_percent': m1_percent,
             'm2_percent': m2_percent,
-            'm1_speed': self.shared['m1_speed'] * 100,  # Convert to percentage
-            'm2_speed': self.shared['m2_speed'] * 100,  # Convert to percentage
-            'auto_close_active': self.shared['auto_close_active'],
-            'auto_close_countdown': self.shared['auto_close_countdown'],
+            'm1_speed': m1_speed * 100,  # Convert to percentage
+            'm2_speed': m2_speed * 100,  # Convert to percentage
+            'auto_close_active': shared['auto_close_active'],
+            'auto_close_countdown': shared['auto_close_countdown'],
             # Separate partial timers
-            'partial_1_auto_close_active': self.shared['partial_1_auto_close_active'],
-            'partial_1_auto_close_countdown': self.shared['partial_1_auto_close_countdown'],
-            'partial_2_auto_close_active': self.shared['partial_2_auto_close_active'],
-            'partial_2_auto_close_countdown': self.shared['partial_2_auto_close_countdown']
+            'partial_1_auto_close_active': shared['partial_1_auto_close_active'],
+            'partial_1_auto_close_countdown': shared['partial_1_auto_close_countdown'],
+            'partial_2_auto_close_active': shared['partial_2_auto_close_active'],
+            'partial_2_auto_close_countdown': shared['partial_2_auto_close_countdown']
         }
     
     def cleanup(self):
         """Clean up processes"""
         print("Shutting down gate controller...")
         self.shared['running'] = False
+        self.wake_motor()
         
         # Wait for motor process to stop
         if self.motor_process.is_alive():
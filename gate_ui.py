@@ -1958,6 +1958,7 @@ class GateUI:
         """Toggle deadman open"""
         self.deadman_open_active = not self.deadman_open_active
         self.controller.shared['deadman_open_active'] = self.deadman_open_active
+        self.controller.wake_motor()
         
         if self.deadman_open_active:
             print("DEADMAN OPEN activated!")
@@ -1970,6 +1971,7 @@ class GateUI:
         """Toggle deadman close"""
         self.deadman_close_active = not self.deadman_close_active
         self.controller.shared['deadman_close_active'] = self.deadman_close_active
+        self.controller.wake_motor()
         
         if self.deadman_close_active:
             print("DEADMAN CLOSE activated!")
@@ -2170,6 +2172,7 @@ class GateUI:
 
                 # Disable engineer mode
                 self.controller.shared['engineer_mode_enabled'] = False
+                self.controller.wake_motor()
                 print("Engineer mode disabled")
 
                 # Update the engineer mode checkbox if it exists
@@ -2227,6 +2230,7 @@ class GateUI:
         
         # Stop all control loops
         self.controller.shared['running'] = False
+        self.controller.wake_motor()
         
         # Give processes a moment to see the flag
         import time
@@ -2298,6 +2302,7 @@ class GateUI:
         """Toggle engineer mode - blocks normal commands when enabled"""
         enabled = self.engineer_mode_var.get()
         self.controller.shared['engineer_mode_enabled'] = enabled
+        self.controller.wake_motor()
 
         if enabled:
             # learning_mode_check only exists in old learning page, not in consolidated settings
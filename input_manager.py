@@ -42,7 +42,7 @@ def check_adc_hardware():
 
 
 class InputManager:
-    def __init__(self, shared_dict, config):
+    def __init__(self, shared_dict, config, wake_event=None):
         """Initialize input manager
 
         Args:
@@ -50,8 +50,11 @@ class InputManager:
             config: Configuration dict with:
                 - num_inputs: Number of analog inputs (8 for dual ADS1115)
                 - input_sample_rate: Sampling rate in seconds (default 0.005 = 200Hz for fast safety-critical response)
+            wake_event: Motor manager wake event - set on every command flag
+                transition so an idle motor loop reacts at once (e.g. deadman)
         """
         self.shared = shared_dict
+        self.wake_event = wake_event
         self.config = config
         self.num_inputs = config.get('num_inputs', 8)
         self.sample_rate = config.get('input_sample_rate', 0.005)  # 200Hz default for fast safety-critical inputs
@@ -510,6 +513,8 @@ class InputManager:
             previous_state = self._command_states.get(function, None)
             self.shared[flag_name] = active
             self._command_states[function] = active
+            if previous_state != active and self.wake_event is not None:
+                self.wake_event.set()
 
             # Debug: Show state transitions for command inputs (not limit switches or every cycle)
             # This helps diagnose if switches are being ignored
@@ -528,7 +533,7 @@ class InputManager:
 
 
 
-def input_manager_process(shared_dict, config):
+def input_manager_process(shared_dict, config, wake_event=None):
     """Entry point for input manager process"""
-    manager = InputManager(shared_dict, config)
+    manager = InputManager(shared_dict, config, wake_event)
     manager.run()
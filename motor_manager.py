@@ -5,14 +5,136 @@ Handles physical motor control based on shared memory state
 """
 
 from gpiozero import Motor, Device
-from time import time, sleep
+from time import time, sleep, monotonic
 import multiprocessing
+import ctypes
+import os
+import resource
 import lgpio
 
+# mlockall() flags (sys/mman.h)
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+# Duty-cycle resolution used to decide whether a motor speed actually changed
+PWM_STEPS = 256
+
+# Arrival tolerance (seconds of travel) for position-based stopping. Positions
+# are float sums of per-tick increments; within this of the target the motor
+# stops and the position snaps exactly to the target, so drift never builds up
+# across movements.
+POSITION_TOLERANCE = 0.05
+
+# Shortest sleep per control tick, even when behind schedule, so a SCHED_FIFO
+# loop always yields the CPU to the Manager server and IRQ threads
+MIN_TICK_SLEEP = 0.0005
+
+# Movement states that target a partial position (M1 only - M2 has no partials)
+PARTIAL_OPEN_STATES = frozenset(('OPENING_TO_PARTIAL_1', 'OPENING_TO_PARTIAL_2'))
+PARTIAL_CLOSE_STATES = frozenset(('CLOSING_TO_PARTIAL_1', 'CLOSING_TO_PARTIAL_2'))
+OPENING_STATES = frozenset(('OPENING',)) | PARTIAL_OPEN_STATES
+
+
+def calculate_ramp_speed(elapsed, remaining, ramp_time, inv_ramp_time, resume_ramp=None):
+    """Calculate speed (0-1.0) with acceleration and deceleration.
+    Pure float math on its arguments - no instance or shared state access.
+    inv_ramp_time is 1/ramp_time, precomputed so the per-tick math multiplies."""
+    if resume_ramp is not None:
+        return resume_ramp
+
+    if elapsed < ramp_time:
+        return max(0.0, min(1.0, elapsed * inv_ramp_time))
+    elif remaining < ramp_time:
+        return max(0.0, min(1.0, remaining * inv_ramp_time))
+    else:
+        return 1.0
+
+
+class SharedSnapshot:
+    """Local per-loop view of the multiprocessing.Manager shared dict.
+
+    Every access on a Manager DictProxy is a pickle + socket round trip to the
+    manager process, and the motor loop makes dozens of them per cycle.
+    refresh() pulls the whole dict in ONE round trip; reads are then served
+    from the local copy. Writes go to both the local copy and the proxy, so
+    other processes see them immediately and later reads in the same cycle
+    see the new value.
+    """
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+        self._data = {}
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the shared dict (single IPC round trip)"""
+        self._data = self._proxy.copy()
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._proxy[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._proxy.pop(key, None)
+
+
+class MotorTelemetry:
+    """Motor -> controller telemetry slot in shared memory.
+
+    Positions and speeds change every motor tick, and readers such as
+    get_status() would otherwise fetch each one from the Manager dict in a
+    separate round trip (and could see m1 from one tick and m2 from the next).
+    The motor process publishes all four values together; readers copy them
+    straight out of shared memory with no IPC. The Manager dict stays the
+    source of truth - this is a read-only mirror that is only marked active
+    while the motor loop runs the control path (not while idle, when other
+    writers may move positions).
+
+    Publish and read both hold the array's lock. A lock-free seqlock is not
+    safe here: Python has no memory fences, and on the Pi's ARM cores the
+    sequence and field stores can become visible out of order. The semaphore
+    acquire/release orders them, and both critical sections are a copy of a
+    few doubles, so the motor loop never waits long.
+
+    Layout: [active, m1_position, m2_position, m1_speed, m2_speed].
+    """
+
+    FIELDS = 5
+
+    def __init__(self):
+        self._slot = multiprocessing.Array(ctypes.c_double, self.FIELDS,
+                                           lock=multiprocessing.Lock())
+
+    def publish(self, active, m1_position, m2_position, m1_speed, m2_speed):
+        """Write one consistent sample (single writer: the motor process)"""
+        sample = (1.0 if active else 0.0, m1_position, m2_position, m1_speed, m2_speed)
+        with self._slot.get_lock():
+            self._slot.get_obj()[:] = sample
+
+    def read(self):
+        """Return (m1_position, m2_position, m1_speed, m2_speed), or None if
+        the motor loop isn't active"""
+        with self._slot.get_lock():
+            values = self._slot.get_obj()[:]
+        return tuple(values[1:]) if values[0] else None
+
+
 class MotorManager:
-    def __init__(self, shared_dict, config):
+    def __init__(self, shared_dict, config, wake_event=None, telemetry=None):
         """Initialize motor manager with shared memory and config"""
-        self.shared = shared_dict
+        self.shared = SharedSnapshot(shared_dict)
+        self.wake_event = wake_event
+        self.telemetry = telemetry
         
         # Config values
         self.motor1_run_time = config['motor1_run_time']
@@ -24,6 +146,7 @@ class MotorManager:
         self.partial_2_position = config['partial_2_position']
         self.deadman_speed = config['deadman_speed']
         self.ramp_time = config.get('ramp_time', 0.5)  # Default 0.5s if not in config
+        self._inv_ramp_time = 1.0 / self.ramp_time if self.ramp_time > 0 else 0.0
 
         # Limit switch configuration
         self.limit_switches_enabled = config.get('limit_switches_enabled', False)
@@ -36,6 +159,15 @@ class MotorManager:
         self.learning_speed = config.get('learning_speed', 0.3)
         self.open_speed = config.get('open_speed', 1.0)  # User-configurable open speed (0.1-1.0)
         self.close_speed = config.get('close_speed', 1.0)  # User-configurable close speed (0.1-1.0)
+        # Write duty cycle straight to the active PWM pin on speed-only changes
+        # (False = always go through Motor.forward()/backward())
+        self.motor_direct_pwm = config.get('motor_direct_pwm', True)
+        self._build_target_tables()
+        self.config_version = 0  # Last config_snapshot version applied
+        # Diagnostic prints inside the control loop - off in normal operation
+        # since a blocked stdout pipe would stall the loop
+        self.debug = config.get('motor_debug', False)
+        self._last_slowdown_log = {}
         
         # Force release ALL GPIO at system level before initializing motors
         # This fixes "GPIO busy" error from crashed previous sessions
@@ -46,20 +178,31 @@ class MotorManager:
         except:
             pass
         
-        # Also try to close any orphaned lgpio handles (Pi 5 uses chip 4)
-        try:
-            for handle in range(256):  # Check possible handle values
+        # Also close any orphaned lgpio handles (Pi 5 uses chip 4) - only when
+        # this process actually holds gpiochip fds, so a clean start costs nothing
+        orphaned = self._count_gpiochip_fds()
+        if orphaned:
+            print(f"Closing {orphaned} orphaned gpiochip handle(s)")
+            for handle in range(256):  # lgpio hands out the lowest free handle
                 try:
                     lgpio.gpiochip_close(handle)
+                    orphaned -= 1
                 except:
-                    pass
-        except:
-            pass
+                    continue
+                if orphaned <= 0:
+                    break
         
         # Initialize motors
         self.motor1 = Motor(forward=17, backward=18, enable=27, pwm=True)
         self.motor2 = Motor(forward=22, backward=23, enable=4, pwm=True)
 
+        # Last command written to each motor as (direction, quantised duty level) - used by
+        # _set_motor to skip redundant gpiozero/lgpio PWM writes
+        self._m1_last_dir = None
+        self._m1_last_level = None
+        self._m2_last_dir = None
+        self._m2_last_level = None
+
         # Fault tracking (per motor, degrades globally)
         self.m1_consecutive_faults = 0
         self.m2_consecutive_faults = 0
@@ -82,30 +225,83 @@ class MotorManager:
         # Track last movement to detect new movements
         self.last_movement_command = None
 
+        # Control loop timing (absolute deadlines on the monotonic clock)
+        self.loop_period = 0.005       # 200Hz normal control
+        self.slow_loop_period = 0.05   # 20Hz for auto-learn / engineer mode
+        self.loop_delta = self.loop_period
+        self.heartbeat_interval = 0.5  # 2Hz liveness write to shared state
+        self._last_heartbeat = 0
+        self._was_idle = False
+        # Longest idle block on wake_event - bounds the delay for shared-state
+        # writers that don't signal it, and keeps the heartbeat flowing
+        self.idle_wake_timeout = 0.5
+
         print("Motor Manager initialized")
     
-    def _reload_config(self):
-        """Reload config from shared memory"""
-        print("Motor Manager: Reloading config from shared memory...")
-        self.motor1_run_time = self.shared.get('config_motor1_run_time', self.motor1_run_time)
-        self.motor2_run_time = self.shared.get('config_motor2_run_time', self.motor2_run_time)
-        self.motor2_enabled = self.shared.get('config_motor2_enabled', self.motor2_enabled)
-        self.motor1_open_delay = self.shared.get('config_motor1_open_delay', self.motor1_open_delay)
-        self.motor2_close_delay = self.shared.get('config_motor2_close_delay', self.motor2_close_delay)
-        self.partial_1_position = self.shared.get('config_partial_1_position', self.partial_1_position)
-        self.partial_2_position = self.shared.get('config_partial_2_position', self.partial_2_position)
-        self.deadman_speed = self.shared.get('config_deadman_speed', self.deadman_speed)
-        self.ramp_time = self.shared.get('config_ramp_time', self.ramp_time)
-        self.limit_switches_enabled = self.shared.get('config_limit_switches_enabled', self.limit_switches_enabled)
-        self.motor1_use_limit_switches = self.shared.get('config_motor1_use_limit_switches', self.motor1_use_limit_switches)
-        self.motor2_use_limit_switches = self.shared.get('config_motor2_use_limit_switches', self.motor2_use_limit_switches)
-        self.limit_switch_creep_speed = self.shared.get('config_limit_switch_creep_speed', self.limit_switch_creep_speed)
-        self.opening_slowdown_percent = self.shared.get('config_opening_slowdown_percent', self.opening_slowdown_percent)
-        self.closing_slowdown_percent = self.shared.get('config_closing_slowdown_percent', self.closing_slowdown_percent)
-        self.slowdown_distance = self.shared.get('config_slowdown_distance', self.slowdown_distance)
-        self.learning_speed = self.shared.get('config_learning_speed', self.learning_speed)
-        self.open_speed = self.shared.get('config_open_speed', self.open_speed)
-        self.close_speed = self.shared.get('config_close_speed', self.close_speed)
+    def _set_motor(self, motor, speed, direction):
+        """Drive a motor ('forward', 'backward' or 'stop'), skipping the PWM write
+        when direction and speed are unchanged since the last command.
+        Every forward/backward/stop call goes gpiozero -> lgpio -> kernel, so
+        steady-state travel would otherwise rewrite the same duty cycle every loop.
+        Speed is quantised to 1/256 steps so float noise in the ramp/slowdown
+        math doesn't count as a change."""
+        level = round(speed * PWM_STEPS)
+        if motor is self.motor1:
+            if direction == self._m1_last_dir and level == self._m1_last_level:
+                return
+            last_dir = self._m1_last_dir
+            self._m1_last_dir = direction
+            self._m1_last_level = level
+        else:
+            if direction == self._m2_last_dir and level == self._m2_last_level:
+                return
+            last_dir = self._m2_last_dir
+            self._m2_last_dir = direction
+            self._m2_last_level = level
+        speed = level / PWM_STEPS
+
+        if self.motor_direct_pwm and direction == last_dir and direction != 'stop':
+            # Same direction, new speed (ramping): only the active pin's duty
+            # cycle changes. Motor.forward()/backward() would also re-drive the
+            # opposite pin off - one extra lgpio write per speed change.
+            if direction == 'forward':
+                motor.forward_device.value = speed
+            else:
+                motor.backward_device.value = speed
+        elif direction == 'forward':
+            motor.forward(speed)
+        elif direction == 'backward':
+            motor.backward(speed)
+        else:
+            motor.stop()
+
+    def _reload_config(self, snapshot):
+        """Apply a config snapshot published by the controller.
+        The whole snapshot arrives in one shared-dict value, so the loop never
+        runs on a mix of old and new settings."""
+        self.config_version = snapshot['version']
+        self.motor1_run_time = snapshot.get('motor1_run_time', self.motor1_run_time)
+        self.motor2_run_time = snapshot.get('motor2_run_time', self.motor2_run_time)
+        self.motor2_enabled = snapshot.get('motor2_enabled', self.motor2_enabled)
+        self.motor1_open_delay = snapshot.get('motor1_open_delay', self.motor1_open_delay)
+        self.motor2_close_delay = snapshot.get('motor2_close_delay', self.motor2_close_delay)
+        self.partial_1_position = snapshot.get('partial_1_position', self.partial_1_position)
+        self.partial_2_position = snapshot.get('partial_2_position', self.partial_2_position)
+        self.deadman_speed = snapshot.get('deadman_speed', self.deadman_speed)
+        self.ramp_time = snapshot.get('ramp_time', self.ramp_time)
+        self._inv_ramp_time = 1.0 / self.ramp_time if self.ramp_time > 0 else 0.0
+        self.limit_switches_enabled = snapshot.get('limit_switches_enabled', self.limit_switches_enabled)
+        self.motor1_use_limit_switches = snapshot.get('motor1_use_limit_switches', self.motor1_use_limit_switches)
+        self.motor2_use_limit_switches = snapshot.get('motor2_use_limit_switches', self.motor2_use_limit_switches)
+        self.limit_switch_creep_speed = snapshot.get('limit_switch_creep_speed', self.limit_switch_creep_speed)
+        self.opening_slowdown_percent = snapshot.get('opening_slowdown_percent', self.opening_slowdown_percent)
+        self.closing_slowdown_percent = snapshot.get('closing_slowdown_percent', self.closing_slowdown_percent)
+        self.slowdown_distance = snapshot.get('slowdown_distance', self.slowdown_distance)
+        self.learning_speed = snapshot.get('learning_speed', self.learning_speed)
+        self.open_speed = snapshot.get('open_speed', self.open_speed)
+        self.close_speed = snapshot.get('close_speed', self.close_speed)
+
+        self._build_target_tables()
 
         # Update original speed backup (unless in degraded mode)
         if not self.degraded_mode:
@@ -114,6 +310,34 @@ class MotorManager:
 
         print(f"Motor Manager: Config reloaded - M1: {self.motor1_run_time}s, M2: {self.motor2_run_time}s (enabled={self.motor2_enabled}), open_speed={self.open_speed}, close_speed={self.close_speed}")
 
+    @staticmethod
+    def _count_gpiochip_fds():
+        """Count /dev/gpiochip* fds held by this process (e.g. inherited on fork)"""
+        count = 0
+        try:
+            for fd in os.listdir('/proc/self/fd'):
+                try:
+                    if os.readlink('/proc/self/fd/' + fd).startswith('/dev/gpiochip'):
+                        count += 1
+                except OSError:
+                    pass
+        except OSError:
+            pass
+        return count
+
+    def _build_target_tables(self):
+        """Precompute M1 target position per movement state.
+        States not in a table use the full-travel default (motor1_run_time when
+        opening, 0 when closing). Rebuilt whenever config is reloaded."""
+        self.m1_open_targets = {
+            'OPENING_TO_PARTIAL_1': self.partial_1_position,
+            'OPENING_TO_PARTIAL_2': self.partial_2_position,
+        }
+        self.m1_close_targets = {
+            'CLOSING_TO_PARTIAL_1': self.partial_1_position,
+            'CLOSING_TO_PARTIAL_2': self.partial_2_position,
+        }
+
     def _record_fault(self, motor_num, fault_type, details=""):
         """Record a fault for the specified motor and check if degradation needed
         Only records ONE fault per movement/maneuver"""
@@ -290,25 +514,35 @@ class MotorManager:
         """Main motor control loop - runs at 200Hz (fast response, matches input manager)"""
         print("Motor Manager process started")
 
-        last_loop_time = time()  # Track actual loop timing
+        last_loop_time = monotonic()  # Track actual loop timing
+        next_tick = last_loop_time
+
+        while True:
+            # Pull shared state once per loop - all reads below are local
+            self.shared.refresh()
+            if not self.shared['running']:
+                break
 
-        while self.shared['running']:
             now = time()
 
             # Calculate actual loop interval (not assuming fixed 200Hz)
-            delta_time = now - last_loop_time
-            last_loop_time = now
+            # Monotonic so a wall-clock step (NTP) can't produce a bogus delta
+            loop_time = monotonic()
+            delta_time = loop_time - last_loop_time
+            last_loop_time = loop_time
 
             # Store delta for position updates (use actual time, not assumed 0.005)
             self.loop_delta = delta_time
 
-            # Update heartbeat
-            self.shared['motor_manager_heartbeat'] = now
+            # Update heartbeat (throttled - only a liveness signal, not per-tick data)
+            if now - self._last_heartbeat >= self.heartbeat_interval:
+                self.shared['motor_manager_heartbeat'] = now
+                self._last_heartbeat = now
 
-            # Check for config reload request
-            if self.shared.get('config_reload_flag', False):
-                self._reload_config()
-                self.shared['config_reload_flag'] = False
+            # Check for a newly published config snapshot
+            config_snapshot = self.shared.get('config_snapshot')
+            if config_snapshot is not None and config_snapshot['version'] != self.config_version:
+                self._reload_config(config_snapshot)
 
             # Detect new movement and reset "fault this movement" flags
             current_movement = self.shared.get('movement_command')
@@ -320,17 +554,43 @@ class MotorManager:
                     self.m2_fault_this_movement = False
                 self.last_movement_command = current_movement
 
+            # Idle fast path - nothing moving and no manual/diagnostic mode, so
+            # skip the control logic and wait for a wake (or poll at the slow
+            # rate without one). The first idle tick still runs the full path
+            # so the motors are stopped cleanly.
+            s = self.shared
+            idle = not (s['movement_start_time'] or s['safety_reversing'] or
+                        s['deadman_open_active'] or s['deadman_close_active'] or
+                        s.get('m1_move_start') or s.get('m2_move_start') or
+                        s.get('auto_learn_active', False) or
+                        s.get('engineer_mode_enabled', False))
+            if idle and self._was_idle:
+                if self.wake_event is not None:
+                    # Block until the controller requests motion (or timeout)
+                    self.wake_event.wait(self.idle_wake_timeout)
+                    self.wake_event.clear()
+                    next_tick = monotonic()
+                else:
+                    next_tick = self._wait_for_next_tick(next_tick, self.slow_loop_period)
+                continue
+            if self._was_idle:
+                # Motors were stopped for the whole idle gap - don't integrate it
+                self.loop_delta = self.loop_period
+            self._was_idle = idle
+
             # If auto-learn is active, handle it exclusively
             if self.shared.get('auto_learn_active', False):
                 self._process_auto_learn(now)
-                sleep(0.05)
+                self._publish_telemetry(True)
+                next_tick = self._wait_for_next_tick(next_tick, self.slow_loop_period)
                 continue
 
             # Check engineer mode controls (HIGHEST PRIORITY - bypasses ALL safety)
             engineer_active = self._process_engineer_controls(now)
             if engineer_active:
                 # Skip all normal control logic when engineer mode is active
-                sleep(0.05)
+                self._publish_telemetry(True)
+                next_tick = self._wait_for_next_tick(next_tick, self.slow_loop_period)
                 continue
 
             # Check deadman controls (direct motor control)
@@ -340,24 +600,44 @@ class MotorManager:
             if self.limit_switches_enabled:
                 self._process_limit_switches(now)
 
-            # Update motor speeds FIRST (ALWAYS - handles safety reversal, deadman, and normal movement)
-            # This calculates the speed that motors will run at this cycle
+            # Update motor speeds and positions (handles safety reversal and normal movement)
             if not deadman_active:
-                self._update_motor_speeds(now)
+                self._tick(now)
 
-            # Update motor positions SECOND using the speed calculated above
-            # This ensures position tracking matches actual motor movement
-            if self.shared['movement_start_time'] and not self.shared['opening_paused'] and not self.shared['safety_reversing'] and not deadman_active:
-                self._update_motor_positions(now)
+            # Telemetry mirror goes inactive on the idle tick so readers fall
+            # back to the shared dict while other writers may move positions
+            self._publish_telemetry(not idle)
 
-            # Sleep 5ms (200Hz)
-            sleep(0.005)
+            # Sleep until the next 5ms deadline (200Hz)
+            next_tick = self._wait_for_next_tick(next_tick, self.loop_period)
         
         # Cleanup on exit
         self.motor1.stop()
         self.motor2.stop()
         print("Motor Manager process stopped")
 
+    def _publish_telemetry(self, active):
+        """Mirror positions/speeds into the telemetry slot (if one was given)"""
+        if self.telemetry is not None:
+            s = self.shared
+            self.telemetry.publish(active, s['m1_position'], s['m2_position'],
+                                   s['m1_speed'], s['m2_speed'])
+
+    def _wait_for_next_tick(self, next_tick, period):
+        """Sleep until the next absolute deadline and return it.
+        A plain sleep(period) makes the real period = period + loop work + wakeup
+        jitter, so the loop drifts. Scheduling against absolute monotonic deadlines
+        keeps the average period exact. If we fall more than a whole period behind
+        (e.g. CPU starved), resync instead of bursting through the missed ticks.
+        Behind schedule we still sleep MIN_TICK_SLEEP - under SCHED_FIFO a loop
+        that never sleeps starves the Manager server it reads shared state from."""
+        next_tick += period
+        delay = next_tick - monotonic()
+        sleep(max(delay, MIN_TICK_SLEEP))
+        if delay < -period:
+            next_tick = monotonic()
+        return next_tick
+
     def _process_auto_learn(self, now):
         """Process auto-learn state machine - progressive learning: 0.25 -> 0.5 -> full speed"""
         # Initialize state on first call or restart after completion
@@ -410,21 +690,21 @@ class MotorManager:
 
         # State: INITIAL_CLOSE_M2 - Close M2 to get to starting position
         elif state == 'INITIAL_CLOSE_M2':
-            self.motor1.stop()
-            self.motor2.backward(0.25)
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.25, 'backward')
             if self.shared.get('close_limit_m2_active', False):
                 print("M2 at close limit")
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
                 self.shared['auto_learn_state'] = 'INITIAL_CLOSE_M1'
                 self.shared['auto_learn_m1_start'] = now
 
         # State: INITIAL_CLOSE_M1 - Close M1 to get to starting position
         elif state == 'INITIAL_CLOSE_M1':
-            self.motor1.backward(0.25)
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.25, 'backward')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if self.shared.get('close_limit_m1_active', False):
                 print("M1 at close limit - ready to start learning sequence")
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
                 # Reset positions and start the normal sequence
                 self.shared['m1_position'] = 0.0
                 self.shared['m2_position'] = 0.0
@@ -433,8 +713,8 @@ class MotorManager:
 
         # State: PAUSE_BEFORE_START - Brief pause before starting learning sequence
         elif state == 'PAUSE_BEFORE_START':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 1.0:
                 print("\nStarting learning sequence from closed position...")
                 print("Step 1: Opening M1 at 0.25 speed to find open limit...")
@@ -444,8 +724,8 @@ class MotorManager:
 
         # State: M1_OPEN_025 - M1 opening at 0.25 speed to find limit
         elif state == 'M1_OPEN_025':
-            self.motor1.forward(0.25)
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.25, 'forward')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if self.shared.get('open_limit_m1_active', False):
                 time_taken = now - self.shared['auto_learn_m1_start']
                 # Convert to full-speed equivalent: time * speed
@@ -460,15 +740,15 @@ class MotorManager:
                 self.shared['auto_learn_m1_open_count'] = count + 1
                 print(f"M1 open: {time_taken:.2f}s at 0.25 speed = {full_speed_time:.2f}s full speed")
                 print(f"  M1 open average: {self.shared['auto_learn_m1_open_avg']:.2f}s ({self.shared['auto_learn_m1_open_count']} samples)")
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
 
                 self.shared['auto_learn_state'] = 'PAUSE_1'
                 self.shared['auto_learn_phase_start'] = now
 
         # State: PAUSE_1 - Brief pause before M2 opens
         elif state == 'PAUSE_1':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 0.5:
                 print("Step 2: Opening M2 at 0.25 speed to find open limit...")
                 self.shared['auto_learn_state'] = 'M2_OPEN_025'
@@ -477,8 +757,8 @@ class MotorManager:
 
         # State: M2_OPEN_025 - M2 opening at 0.25 speed to find limit
         elif state == 'M2_OPEN_025':
-            self.motor1.stop()
-            self.motor2.forward(0.25)
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.25, 'forward')
             if self.shared.get('open_limit_m2_active', False):
                 time_taken = now - self.shared['auto_learn_m2_start']
                 full_speed_time = time_taken * 0.25
@@ -491,15 +771,15 @@ class MotorManager:
                 self.shared['auto_learn_m2_open_count'] = count + 1
                 print(f"M2 open: {time_taken:.2f}s at 0.25 speed = {full_speed_time:.2f}s full speed")
                 print(f"  M2 open average: {self.shared['auto_learn_m2_open_avg']:.2f}s ({self.shared['auto_learn_m2_open_count']} samples)")
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
 
                 self.shared['auto_learn_state'] = 'PAUSE_2'
                 self.shared['auto_learn_phase_start'] = now
 
         # State: PAUSE_2 - Brief pause before M2 closes
         elif state == 'PAUSE_2':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 0.5:
                 print("Step 3: Closing M2 at 0.25 speed to record close time...")
                 self.shared['auto_learn_state'] = 'M2_CLOSE_025'
@@ -508,8 +788,8 @@ class MotorManager:
 
         # State: M2_CLOSE_025 - M2 closing at 0.25 speed, record time
         elif state == 'M2_CLOSE_025':
-            self.motor1.stop()
-            self.motor2.backward(0.25)
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.25, 'backward')
             if self.shared.get('close_limit_m2_active', False):
                 time_taken = now - self.shared['auto_learn_m2_start']
                 full_speed_time = time_taken * 0.25
@@ -522,15 +802,15 @@ class MotorManager:
                 self.shared['auto_learn_m2_close_count'] = count + 1
                 print(f"M2 close: {time_taken:.2f}s at 0.25 speed = {full_speed_time:.2f}s full speed")
                 print(f"  M2 close average: {self.shared['auto_learn_m2_close_avg']:.2f}s ({self.shared['auto_learn_m2_close_count']} samples)")
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
 
                 self.shared['auto_learn_state'] = 'PAUSE_3'
                 self.shared['auto_learn_phase_start'] = now
 
         # State: PAUSE_3 - Brief pause before M1 closes
         elif state == 'PAUSE_3':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 0.5:
                 print("Step 4: Closing M1 at 0.25 speed to record close time...")
                 self.shared['auto_learn_state'] = 'M1_CLOSE_025'
@@ -539,8 +819,8 @@ class MotorManager:
 
         # State: M1_CLOSE_025 - M1 closing at 0.25 speed, record time
         elif state == 'M1_CLOSE_025':
-            self.motor1.backward(0.25)
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.25, 'backward')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if self.shared.get('close_limit_m1_active', False):
                 time_taken = now - self.shared['auto_learn_m1_start']
                 full_speed_time = time_taken * 0.25
@@ -553,15 +833,15 @@ class MotorManager:
                 self.shared['auto_learn_m1_close_count'] = count + 1
                 print(f"M1 close: {time_taken:.2f}s at 0.25 speed = {full_speed_time:.2f}s full speed")
                 print(f"  M1 close average: {self.shared['auto_learn_m1_close_avg']:.2f}s ({self.shared['auto_learn_m1_close_count']} samples)")
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
 
                 self.shared['auto_learn_state'] = 'PAUSE_4'
                 self.shared['auto_learn_phase_start'] = now
 
         # State: PAUSE_4 - Brief pause before 0.5 speed cycles
         elif state == 'PAUSE_4':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 1.0:
                 print("\n=== Phase 2: 0.5 Speed Cycles ===")
                 print("Step 5: Opening M1 at 0.5 speed...")
@@ -571,8 +851,8 @@ class MotorManager:
 
         # State: M1_OPEN_05 - M1 opening at 0.5 speed
         elif state == 'M1_OPEN_05':
-            self.motor1.forward(0.5)
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.5, 'forward')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if self.shared.get('open_limit_m1_active', False):
                 time_taken = now - self.shared['auto_learn_m1_start']
                 full_speed_time = time_taken * 0.5
@@ -582,15 +862,15 @@ class MotorManager:
                 self.shared['auto_learn_m1_open_count'] = count + 1
                 print(f"M1 open: {time_taken:.2f}s at 0.5 speed = {full_speed_time:.2f}s full speed")
                 print(f"  M1 open average: {self.shared['auto_learn_m1_open_avg']:.2f}s ({self.shared['auto_learn_m1_open_count']} samples)")
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
 
                 self.shared['auto_learn_state'] = 'PAUSE_5'
                 self.shared['auto_learn_phase_start'] = now
 
         # State: PAUSE_5 - Brief pause before M2 opens at 0.5
         elif state == 'PAUSE_5':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 0.5:
                 print("Step 6: Opening M2 at 0.5 speed...")
                 self.shared['auto_learn_state'] = 'M2_OPEN_05'
@@ -599,8 +879,8 @@ class MotorManager:
 
         # State: M2_OPEN_05 - M2 opening at 0.5 speed
         elif state == 'M2_OPEN_05':
-            self.motor1.stop()
-            self.motor2.forward(0.5)
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.5, 'forward')
             if self.shared.get('open_limit_m2_active', False):
                 time_taken = now - self.shared['auto_learn_m2_start']
                 full_speed_time = time_taken * 0.5
@@ -610,15 +890,15 @@ class MotorManager:
                 self.shared['auto_learn_m2_open_count'] = count + 1
                 print(f"M2 open: {time_taken:.2f}s at 0.5 speed = {full_speed_time:.2f}s full speed")
                 print(f"  M2 open average: {self.shared['auto_learn_m2_open_avg']:.2f}s ({self.shared['auto_learn_m2_open_count']} samples)")
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
 
                 self.shared['auto_learn_state'] = 'PAUSE_6'
                 self.shared['auto_learn_phase_start'] = now
 
         # State: PAUSE_6 - Brief pause before M2 closes at 0.5
         elif state == 'PAUSE_6':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 0.5:
                 print("Step 7: Closing M2 at 0.5 speed...")
                 self.shared['auto_learn_state'] = 'M2_CLOSE_05'
@@ -627,8 +907,8 @@ class MotorManager:
 
         # State: M2_CLOSE_05 - M2 closing at 0.5 speed
         elif state == 'M2_CLOSE_05':
-            self.motor1.stop()
-            self.motor2.backward(0.5)
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.5, 'backward')
             if self.shared.get('close_limit_m2_active', False):
                 time_taken = now - self.shared['auto_learn_m2_start']
                 full_speed_time = time_taken * 0.5
@@ -638,15 +918,15 @@ class MotorManager:
                 self.shared['auto_learn_m2_close_count'] = count + 1
                 print(f"M2 close: {time_taken:.2f}s at 0.5 speed = {full_speed_time:.2f}s full speed")
                 print(f"  M2 close average: {self.shared['auto_learn_m2_close_avg']:.2f}s ({self.shared['auto_learn_m2_close_count']} samples)")
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
 
                 self.shared['auto_learn_state'] = 'PAUSE_7'
                 self.shared['auto_learn_phase_start'] = now
 
         # State: PAUSE_7 - Brief pause before M1 closes at 0.5
         elif state == 'PAUSE_7':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 0.5:
                 print("Step 8: Closing M1 at 0.5 speed...")
                 self.shared['auto_learn_state'] = 'M1_CLOSE_05'
@@ -655,8 +935,8 @@ class MotorManager:
 
         # State: M1_CLOSE_05 - M1 closing at 0.5 speed
         elif state == 'M1_CLOSE_05':
-            self.motor1.backward(0.5)
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.5, 'backward')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if self.shared.get('close_limit_m1_active', False):
                 time_taken = now - self.shared['auto_learn_m1_start']
                 full_speed_time = time_taken * 0.5
@@ -666,7 +946,7 @@ class MotorManager:
                 self.shared['auto_learn_m1_close_count'] = count + 1
                 print(f"M1 close: {time_taken:.2f}s at 0.5 speed = {full_speed_time:.2f}s full speed")
                 print(f"  M1 close average: {self.shared['auto_learn_m1_close_avg']:.2f}s ({self.shared['auto_learn_m1_close_count']} samples)")
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
 
                 self.shared['auto_learn_state'] = 'PAUSE_8'
                 self.shared['auto_learn_phase_start'] = now
@@ -674,8 +954,8 @@ class MotorManager:
 
         # State: PAUSE_8 - Prepare for full-speed cycles
         elif state == 'PAUSE_8':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 1.0:
                 print("\n=== Phase 3: Full-Speed Cycles with Minimal Slowdown ===")
                 self.shared['auto_learn_cycle'] = 1
@@ -714,7 +994,7 @@ class MotorManager:
                 if not self.shared.get('open_limit_m1_active', False):
                     # Not at limit yet - keep moving
                     if m1_elapsed < m1_slowdown_point:
-                        self.motor1.forward(1.0)  # Full speed
+                        self._set_motor(self.motor1, 1.0, 'forward')  # Full speed
                         # Update position: position += loop_time * speed
                         self.shared['auto_learn_m1_position'] += self.loop_delta *1.0
                     else:
@@ -736,7 +1016,7 @@ class MotorManager:
                             speed = self.limit_switch_creep_speed + (speed_range * (remaining / slowdown_zone))
                             speed = max(self.limit_switch_creep_speed, min(1.0, speed))
 
-                        self.motor1.forward(speed)
+                        self._set_motor(self.motor1, speed, 'forward')
                         # Update position at current speed
                         self.shared['auto_learn_m1_position'] += self.loop_delta *speed
                 else:
@@ -751,10 +1031,10 @@ class MotorManager:
                         print(f"  M1 open limit: {final_position:.2f}s position (wall-clock: {m1_elapsed:.2f}s)")
                         print(f"    M1 open average: {self.shared['auto_learn_m1_open_avg']:.2f}s ({self.shared['auto_learn_m1_open_count']} samples)")
                         self.shared['auto_learn_m1_start'] = None
-                    self.motor1.stop()
+                    self._set_motor(self.motor1, 0.0, 'stop')
                     m1_done = True
             else:
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
                 m1_done = True
 
             # M2 control (starts after delay)
@@ -763,7 +1043,7 @@ class MotorManager:
                 m2_elapsed = now - self.shared['auto_learn_m2_start']
                 if not self.shared.get('open_limit_m2_active', False):
                     if m2_elapsed < m2_slowdown_point:
-                        self.motor2.forward(1.0)  # Full speed
+                        self._set_motor(self.motor2, 1.0, 'forward')  # Full speed
                         # Update position: position += loop_time * speed
                         self.shared['auto_learn_m2_position'] += self.loop_delta *1.0
                     else:
@@ -783,7 +1063,7 @@ class MotorManager:
                             speed = self.limit_switch_creep_speed + (speed_range * (remaining / slowdown_zone))
                             speed = max(self.limit_switch_creep_speed, min(1.0, speed))
 
-                        self.motor2.forward(speed)
+                        self._set_motor(self.motor2, speed, 'forward')
                         # Update position at current speed
                         self.shared['auto_learn_m2_position'] += self.loop_delta *speed
                 else:
@@ -797,10 +1077,10 @@ class MotorManager:
                         print(f"  M2 open limit: {final_position:.2f}s position (wall-clock: {m2_elapsed:.2f}s)")
                         print(f"    M2 open average: {self.shared['auto_learn_m2_open_avg']:.2f}s ({self.shared['auto_learn_m2_open_count']} samples)")
                         self.shared['auto_learn_m2_start'] = None
-                    self.motor2.stop()
+                    self._set_motor(self.motor2, 0.0, 'stop')
                     m2_done = True
             else:
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
                 m2_done = True
 
             # When both motors at open limit, pause before close
@@ -810,8 +1090,8 @@ class MotorManager:
 
         # State: PAUSE_BEFORE_FULL_CLOSE
         elif state == 'PAUSE_BEFORE_FULL_CLOSE':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 0.5:
                 cycle = self.shared['auto_learn_cycle']
                 print(f"Cycle {cycle}: Closing at full speed (M2 then M1 with {self.motor2_close_delay}s delay)...")
@@ -843,7 +1123,7 @@ class MotorManager:
                 m2_elapsed = now - self.shared['auto_learn_m2_start']
                 if not self.shared.get('close_limit_m2_active', False):
                     if m2_elapsed < m2_slowdown_point:
-                        self.motor2.backward(1.0)  # Full speed
+                        self._set_motor(self.motor2, 1.0, 'backward')  # Full speed
                         # Update position: position += loop_time * speed
                         self.shared['auto_learn_m2_position'] += self.loop_delta *1.0
                     else:
@@ -863,7 +1143,7 @@ class MotorManager:
                             speed = self.limit_switch_creep_speed + (speed_range * (remaining / slowdown_zone))
                             speed = max(self.limit_switch_creep_speed, min(1.0, speed))
 
-                        self.motor2.backward(speed)
+                        self._set_motor(self.motor2, speed, 'backward')
                         # Update position at current speed
                         self.shared['auto_learn_m2_position'] += self.loop_delta *speed
                 else:
@@ -877,10 +1157,10 @@ class MotorManager:
                         print(f"  M2 close limit: {final_position:.2f}s position (wall-clock: {m2_elapsed:.2f}s)")
                         print(f"    M2 close average: {self.shared['auto_learn_m2_close_avg']:.2f}s ({self.shared['auto_learn_m2_close_count']} samples)")
                         self.shared['auto_learn_m2_start'] = None
-                    self.motor2.stop()
+                    self._set_motor(self.motor2, 0.0, 'stop')
                     m2_done = True
             else:
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
                 m2_done = True
 
             # M1 control (starts after delay)
@@ -889,9 +1169,9 @@ class MotorManager:
                 m1_elapsed = now - self.shared['auto_learn_m1_start']
                 if not self.shared.get('close_limit_m1_active', False):
                     if m1_elapsed < m1_slowdown_point:
-                        self.motor1.backward(1.0)  # Full speed
+                        self._set_motor(self.motor1, 1.0, 'backward')  # Full speed
                         # Update position: position += loop_time * speed
-                        self.shared['auto_learn_m1_position'] += 0.05 * 1.0
+                        self.shared['auto_learn_m1_position'] += self.loop_delta * 1.0
                     else:
                         # In slowdown zone - GRADUAL ramp from full speed to creep speed
                         if not self.shared.get('auto_learn_m1_slowdown'):
@@ -909,7 +1189,7 @@ class MotorManager:
                             speed = self.limit_switch_creep_speed + (speed_range * (remaining / slowdown_zone))
                             speed = max(self.limit_switch_creep_speed, min(1.0, speed))
 
-                        self.motor1.backward(speed)
+                        self._set_motor(self.motor1, speed, 'backward')
                         # Update position at current speed
                         self.shared['auto_learn_m1_position'] += self.loop_delta *speed
                 else:
@@ -923,10 +1203,10 @@ class MotorManager:
                         print(f"  M1 close limit: {final_position:.2f}s position (wall-clock: {m1_elapsed:.2f}s)")
                         print(f"    M1 close average: {self.shared['auto_learn_m1_close_avg']:.2f}s ({self.shared['auto_learn_m1_close_count']} samples)")
                         self.shared['auto_learn_m1_start'] = None
-                    self.motor1.stop()
+                    self._set_motor(self.motor1, 0.0, 'stop')
                     m1_done = True
             else:
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
                 m1_done = True
 
             # When both motors at close limit, check if need more cycles
@@ -944,15 +1224,15 @@ class MotorManager:
 
         # State: PAUSE_BEFORE_NEXT_CYCLE
         elif state == 'PAUSE_BEFORE_NEXT_CYCLE':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
             if now - self.shared['auto_learn_phase_start'] >= 1.0:
                 self.shared['auto_learn_state'] = 'FULL_OPEN_START'
 
         # State: COMPLETE - Calculate final averages and overall work time
         elif state == 'COMPLETE':
-            self.motor1.stop()
-            self.motor2.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
 
             print("\n=== AUTO-LEARN COMPLETE ===")
 
@@ -1022,7 +1302,7 @@ class MotorManager:
                         self.shared['learning_m1_start_time'] = None
 
                 # Stop motor and set to full open position
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
                 position_percent = (self.shared['m1_position'] / self.motor1_run_time * 100.0) if self.motor1_run_time > 0 else 0.0
 
                 # Only print if position wasn't already at the limit (avoid spam)
@@ -1050,7 +1330,7 @@ class MotorManager:
                         self.shared['learning_m1_start_time'] = None
 
                 # Stop motor and set to fully closed position
-                self.motor1.stop()
+                self._set_motor(self.motor1, 0.0, 'stop')
                 position_percent = (self.shared['m1_position'] / self.motor1_run_time * 100.0) if self.motor1_run_time > 0 else 0.0
 
                 # Only print if position wasn't already at the limit (avoid spam)
@@ -1091,7 +1371,7 @@ class MotorManager:
                     self._m2_open_limit_logged = True
 
                 # Always stop and sync position (but only log once)
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
                 self.shared['m2_position'] = self.motor2_run_time
                 self.shared['m2_speed'] = 0.0
         else:
@@ -1125,7 +1405,7 @@ class MotorManager:
                     self._m2_close_limit_logged = True
 
                 # Always stop and sync position (but only log once)
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
                 self.shared['m2_position'] = 0.0
                 self.shared['m2_speed'] = 0.0
         else:
@@ -1161,588 +1441,435 @@ class MotorManager:
 
         # Motor 1 Open (forward direction)
         if self.shared.get('engineer_motor1_open', False):
-            self.motor1.forward(0.3)  # Fixed 30% speed for safety
+            self._set_motor(self.motor1, 0.3, 'forward')  # Fixed 30% speed for safety
             any_active = True
         # Motor 1 Close (backward direction)
         elif self.shared.get('engineer_motor1_close', False):
-            self.motor1.backward(0.3)  # Fixed 30% speed for safety
+            self._set_motor(self.motor1, 0.3, 'backward')  # Fixed 30% speed for safety
             any_active = True
         else:
             # Stop motor 1 if no engineer command
-            self.motor1.stop()
+            self._set_motor(self.motor1, 0.0, 'stop')
 
         # Motor 2 Open (forward direction)
         if self.motor2_enabled:
             if self.shared.get('engineer_motor2_open', False):
-                self.motor2.forward(0.3)  # Fixed 30% speed for safety
+                self._set_motor(self.motor2, 0.3, 'forward')  # Fixed 30% speed for safety
                 any_active = True
             # Motor 2 Close (backward direction)
             elif self.shared.get('engineer_motor2_close', False):
-                self.motor2.backward(0.3)  # Fixed 30% speed for safety
+                self._set_motor(self.motor2, 0.3, 'backward')  # Fixed 30% speed for safety
                 any_active = True
             else:
                 # Stop motor 2 if no engineer command
-                self.motor2.stop()
+                self._set_motor(self.motor2, 0.0, 'stop')
 
         return any_active
 
     def _process_deadman_controls(self, now):
         """Handle deadman controls - direct motor operation"""
-        if self.shared['deadman_open_active'] and self.shared['deadman_close_active']:
+        s = self.shared
+        deadman_open = s['deadman_open_active']
+        deadman_close = s['deadman_close_active']
+        if deadman_open and deadman_close:
             return False
-        
-        if self.shared['deadman_open_active']:
+
+        if not (deadman_open or deadman_close):
+            return False
+
+        m1p_in = m1p = s['m1_position']
+        m2p_in = m2p = s['m2_position']
+
+        if deadman_open:
             # Use each motor's actual run time (learned if available, else configured)
-            if self.shared['m1_position'] < self.motor1_run_time or self.shared['m2_position'] < self.motor2_run_time:
-                self.motor1.forward(self.deadman_speed)
-                self.motor2.forward(self.deadman_speed)
-                self.shared['m1_position'] = min(self.motor1_run_time, self.shared['m1_position'] + self.loop_delta * self.deadman_speed)
-                self.shared['m2_position'] = min(self.motor2_run_time, self.shared['m2_position'] + self.loop_delta * self.deadman_speed)
+            if m1p < self.motor1_run_time or m2p < self.motor2_run_time:
+                self._set_motor(self.motor1, self.deadman_speed, 'forward')
+                self._set_motor(self.motor2, self.deadman_speed, 'forward')
+                m1p = self._integrate_position(m1p, self.deadman_speed, 1, self.motor1_run_time)
+                m2p = self._integrate_position(m2p, self.deadman_speed, 1, self.motor2_run_time)
             else:
-                self.motor1.stop()
-                self.motor2.stop()
-                self.shared['state'] = 'OPEN'
-            return True
-        
-        elif self.shared['deadman_close_active']:
-            if self.shared['m1_position'] > 0 or self.shared['m2_position'] > 0:
-                self.motor1.backward(self.deadman_speed)
-                self.motor2.backward(self.deadman_speed)
-                self.shared['m1_position'] = max(0, self.shared['m1_position'] - self.loop_delta * self.deadman_speed)
-                self.shared['m2_position'] = max(0, self.shared['m2_position'] - self.loop_delta * self.deadman_speed)
+                self._set_motor(self.motor1, 0.0, 'stop')
+                self._set_motor(self.motor2, 0.0, 'stop')
+                if s['state'] != 'OPEN':
+                    s['state'] = 'OPEN'
+        else:
+            if m1p > 0 or m2p > 0:
+                self._set_motor(self.motor1, self.deadman_speed, 'backward')
+                self._set_motor(self.motor2, self.deadman_speed, 'backward')
+                m1p = self._integrate_position(m1p, self.deadman_speed, -1, 0)
+                m2p = self._integrate_position(m2p, self.deadman_speed, -1, 0)
             else:
-                self.motor1.stop()
-                self.motor2.stop()
-                self.shared['state'] = 'CLOSED'
-            return True
-        
-        return False
-    
-    def _update_motor_positions(self, now):
-        """Update motor positions based on actual motor speed over time"""
-        ramp_time = self.ramp_time
-        
-        if self.shared['movement_command'] == 'OPEN':
-            # Motor 1 position update
-            m1_move_start = self.shared.get('m1_move_start')
-            if m1_move_start:
-                elapsed = now - m1_move_start
-                
-                # Determine target position based on state
-                if self.shared['state'] == 'OPENING_TO_PARTIAL_1':
-                    target_position = self.partial_1_position
-                elif self.shared['state'] == 'OPENING_TO_PARTIAL_2':
-                    target_position = self.partial_2_position
-                else:
-                    # Use M1's actual run time (learned if available, else configured)
-                    target_position = self.motor1_run_time
-
-                # DEBUG: Log partial position movements
-                # DISABLED - too much spam
-                # if self.shared['state'] in ['OPENING_TO_PARTIAL_1', 'OPENING_TO_PARTIAL_2']:
-                #     if not hasattr(self, '_last_partial_open_debug') or (now - self._last_partial_open_debug) > 0.5:
-                #         print(f"[PARTIAL DEBUG OPEN] M1: pos={self.shared['m1_position']:.2f}s target={target_position:.2f}s motor1_run_time={self.motor1_run_time:.2f}s")
-                #         self._last_partial_open_debug = now
-
-                # Get actual motor speed to determine if motor is running
-                speed = self.shared.get('m1_speed', 0.0)
-
-                # Only update position if motor is actually running (speed > 0)
-                # This prevents position from incrementing when motor is stopped
-                if speed > 0:
-                    # Update position: position += (loop_interval * actual_motor_speed)
-                    # Using 0.005s as the loop interval (200Hz)
-                    # Speed already includes all multipliers and slowdown from _update_motor_speeds
-                    # Allow position to exceed target when limit switches enabled (no clamping to target_position)
-                    if self.motor1_use_limit_switches and self.shared['state'] == 'OPENING':
-                        # With limit switches: allow position to go beyond target until limit hit
-                        self.shared['m1_position'] = self.shared['m1_position'] + (self.loop_delta * speed)
-                    else:
-                        # Without limit switches: clamp to target position
-                        self.shared['m1_position'] = min(target_position, self.shared['m1_position'] + (self.loop_delta * speed))
-            
-            # Motor 2 position update
-            if self.shared['m2_move_start']:
-                # Get actual motor speed to determine if motor is running
-                speed = self.shared.get('m2_speed', 0.0)
-
-                # Only update position if motor is actually running (speed > 0)
-                # This prevents position from incrementing when motor is stopped
-                if speed > 0:
-                    # Update position: position += (loop_interval * actual_motor_speed)
-                    # Speed already includes all multipliers and slowdown from _update_motor_speeds
-                    # Allow position to exceed target when limit switches enabled
-                    if self.motor2_use_limit_switches:
-                        # With limit switches: allow position to go beyond target until limit hit
-                        self.shared['m2_position'] = self.shared['m2_position'] + (self.loop_delta * speed)
-                    else:
-                        # Without limit switches: clamp to target position
-                        self.shared['m2_position'] = min(self.motor2_run_time, self.shared['m2_position'] + (self.loop_delta * speed))
-            elif (self.shared['m1_move_start'] and 
-                  (now - self.shared['movement_start_time']) >= self.motor1_open_delay and
-                  self.shared['state'] not in ['OPENING_TO_PARTIAL_1', 'OPENING_TO_PARTIAL_2']):
-                self.shared['m2_move_start'] = now
-                self.shared['m2_target'] = self.shared['m2_position']
-        
-        elif self.shared['movement_command'] == 'CLOSE':
-            # Motor 2 position update (closes first)
-            if self.shared['m2_move_start']:
-                # Get actual motor speed to determine if motor is running
-                speed = self.shared.get('m2_speed', 0.0)
-
-                # Only update position if motor is actually running (speed > 0)
-                # This prevents position from decrementing when motor is stopped
-                if speed > 0:
-                    # Update position: position -= (loop_interval * actual_motor_speed)
-                    # Speed already includes all multipliers and slowdown from _update_motor_speeds
-                    # Allow position to go negative when limit switches enabled
-                    if self.motor2_use_limit_switches:
-                        # With limit switches: allow position to go negative until limit hit
-                        self.shared['m2_position'] = self.shared['m2_position'] - (self.loop_delta * speed)
-                    else:
-                        # Without limit switches: clamp to zero
-                        self.shared['m2_position'] = max(0, self.shared['m2_position'] - (self.loop_delta * speed))
-            
-            # Motor 1 position update
-            if self.shared['m1_move_start']:
-                # Determine target position based on state
-                if self.shared['state'] == 'CLOSING_TO_PARTIAL_1':
-                    target_position = self.partial_1_position
-                elif self.shared['state'] == 'CLOSING_TO_PARTIAL_2':
-                    target_position = self.partial_2_position
-                else:
-                    target_position = 0
-
-                # DEBUG: Log partial position movements
-                # DISABLED - too much spam
-                # if self.shared['state'] in ['CLOSING_TO_PARTIAL_1', 'CLOSING_TO_PARTIAL_2']:
-                #     if not hasattr(self, '_last_partial_debug') or (now - self._last_partial_debug) > 0.5:
-                #         print(f"[PARTIAL DEBUG] M1: pos={self.shared['m1_position']:.2f}s target={target_position:.2f}s motor1_run_time={self.motor1_run_time:.2f}s")
-                #         self._last_partial_debug = now
-
-                # Get actual motor speed to determine if motor is running
-                speed = self.shared.get('m1_speed', 0.0)
-
-                # Only update position if motor is actually running (speed > 0)
-                # This prevents position from decrementing when motor is stopped
-                if speed > 0:
-                    # Debug: Show position update details every 0.5s
-                    # (Commented out to reduce log spam - uncomment for debugging)
-                    # if not hasattr(self, '_pos_update_debug_close') or (now - self._pos_update_debug_close) > 0.5:
-                    #     old_pos = self.shared['m1_position']
-                    #     delta = self.loop_delta * speed
-                    #     print(f"[M1 POS UPDATE CLOSE] pos={old_pos:.3f}, speed={speed:.3f}, delta=-{delta:.6f}, will_be={old_pos - delta:.3f}, loop_time={self.loop_delta*1000:.1f}ms")
-                    #     self._pos_update_debug_close = now
-                    pass
+                self._set_motor(self.motor1, 0.0, 'stop')
+                self._set_motor(self.motor2, 0.0, 'stop')
+                if s['state'] != 'CLOSED':
+                    s['state'] = 'CLOSED'
+
+        # Write back only what changed
+        if m1p != m1p_in:
+            s['m1_position'] = m1p
+        if m2p != m2p_in:
+            s['m2_position'] = m2p
+        return True
+
+    def _integrate_position(self, position, speed, direction, limit=None):
+        """Advance a position by one loop step (loop_delta * speed).
+        direction is +1 for opening, -1 for closing. limit clamps the result
+        (upper bound when opening, lower bound when closing); None = no clamp,
+        used when limit switches decide where travel ends."""
+        position = position + direction * self.loop_delta * speed
+        if limit is None:
+            return position
+        return min(limit, position) if direction > 0 else max(limit, position)
+
+    def _drive_to_position(self, motor, position, target, speed, direction):
+        """Position-based stopping: drive towards target (direction 1 = open,
+        -1 = close) until within POSITION_TOLERANCE, then stop.
+        Returns the position - snapped to exactly target once stopped."""
+        if direction > 0:
+            if position < target - POSITION_TOLERANCE:
+                self._set_motor(motor, speed, 'forward')
+                return position
+        elif position > target + POSITION_TOLERANCE:
+            self._set_motor(motor, speed, 'backward')
+            return position
+        self._set_motor(motor, 0.0, 'stop')
+        return target
+
+    def _drive_to_open_limit(self, motor_num, motor, position, target, speed, open_limit, close_limit):
+        """Limit-switch opening: keep running until the open limit triggers,
+        with fault checks. Returns the speed to record (0 if stopped on fault)."""
+        # Check for over-travel (150% threshold)
+        if self._check_over_travel(motor_num, position, target, "OPENING"):
+            self._set_motor(motor, 0.0, 'stop')
+            return 0.0  # Reset speed to 0 when stopped
+        # Check limit release at 50% travel
+        elif self._check_limit_release(motor_num, position, target, "OPENING", close_limit):
+            self._set_motor(motor, speed, 'forward')  # Continue but fault is logged
+        # Check limit activation at expected position
+        elif self._check_limit_activation(motor_num, position, target, "OPENING",
+                                          open_limit, close_limit, close_limit, open_limit):
+            self._set_motor(motor, speed, 'forward')  # Continue but fault is logged
+        # Normal operation - keep running until limit hits
+        elif not open_limit:
+            self._set_motor(motor, speed, 'forward')
+        else:
+            # Successfully hit limit
+            self._set_motor(motor, 0.0, 'stop')
+        return speed
+
+    def _drive_to_close_limit(self, motor_num, motor, position, run_time, speed, open_limit, close_limit):
+        """Limit-switch closing: keep running until the close limit triggers,
+        with fault checks. Returns the speed to record (0 if stopped on fault)."""
+        # For closing, position goes from run_time down to 0 (and can go negative with limit switches)
+        # Check for excessive over-travel (safety threshold at -50% of expected travel)
+        # This prevents runaway if limit switch fails
+        over_travel_threshold = -0.5 * run_time  # -50% of run time
+        if position < over_travel_threshold:
+            self._record_fault(motor_num, "OVER_TRAVEL", f"CLOSING - position {position:.2f}s below {over_travel_threshold:.2f}s (excessive overtravel)")
+            self._set_motor(motor, 0.0, 'stop')
+            return 0.0  # Reset speed to 0 when stopped
+        # Check limit release - at 50% travel from open, open limit should be off
+        elif self._check_limit_release(motor_num, run_time - position, run_time, "CLOSING", open_limit):
+            self._set_motor(motor, speed, 'backward')  # Continue but fault is logged
+        # Check limit activation at expected position
+        elif position <= 0.1 and not close_limit:
+            # Near zero but close limit not active
+            if open_limit:
+                self._record_fault(motor_num, "LIMIT_MISSING", "CLOSING - close limit not activated, open still active")
+            else:
+                self._record_fault(motor_num, "LIMIT_MISSING", "CLOSING - close limit not activated at position 0")
+            self._set_motor(motor, speed, 'backward')  # Continue but fault is logged
+        # Normal operation - keep running until limit hits
+        elif not close_limit:
+            self._set_motor(motor, speed, 'backward')
+        else:
+            # Successfully hit limit
+            self._clear_fault(motor_num)
+            self._set_motor(motor, 0.0, 'stop')
+        return speed
+
+    def _tick(self, now):
+        """Set motor speeds based on position and ramping, then advance positions.
+        Speed and position are computed in one pass so each shared field is
+        read once and written back at most once per tick."""
+        # Read everything this tick needs once, write back only changed fields
+        s = self.shared
+        state = s['state']
+        m1_speed_in = m1_speed = s['m1_speed']
+        m2_speed_in = m2_speed = s['m2_speed']
+        m1p_in = m1p = s['m1_position']
+        m2p_in = m2p = s['m2_position']
 
-                    # Update position: position -= (loop_interval * actual_motor_speed)
-                    # Use actual loop delta instead of assumed 0.005 to handle variable loop timing
-                    # Speed already includes all multipliers and slowdown from _update_motor_speeds
-                    # Allow position to go negative when limit switches enabled (no clamping to target_position)
-                    if self.motor1_use_limit_switches and self.shared['state'] == 'CLOSING':
-                        # With limit switches: allow position to go negative until limit hit
-                        self.shared['m1_position'] = self.shared['m1_position'] - (self.loop_delta * speed)
-                    else:
-                        # Without limit switches: clamp to target position
-                        self.shared['m1_position'] = max(target_position, self.shared['m1_position'] - (self.loop_delta * speed))
-            elif (self.shared['m2_move_start'] and
-                  (now - self.shared['movement_start_time']) >= (0 if not self.motor2_enabled else self.motor2_close_delay)):
-                # Start M1 after delay for ALL closing operations (including partial)
-                # Skip delay if motor2 is disabled
-                # Only exclude if we're moving FROM a partial position (not returning from OPEN)
-                if not (self.shared['state'] in ['CLOSING_TO_PARTIAL_1', 'CLOSING_TO_PARTIAL_2'] and
-                        not self.shared.get('returning_from_full_open', False)):
-                    self.shared['m1_move_start'] = now
-                    self.shared['m1_target'] = self.shared['m1_position']
-    
-    def _update_motor_speeds(self, now):
-        """Set motor speeds based on position and ramping"""
         # Handle safety reversal - full speed reverse
-        if self.shared['safety_reversing']:
-            if self.shared['state'] == 'REVERSING_FROM_CLOSE':
+        if s['safety_reversing']:
+            if state == 'REVERSING_FROM_CLOSE':
                 # Was closing, now reverse (open direction)
-                self.motor1.forward(1.0)
-                self.motor2.forward(1.0)
-                self.shared['m1_speed'] = 1.0  # Full speed (0-1.0 scale)
-                self.shared['m2_speed'] = 1.0
-            elif self.shared['state'] == 'REVERSING_FROM_OPEN':
+                self._set_motor(self.motor1, 1.0, 'forward')
+                self._set_motor(self.motor2, 1.0, 'forward')
+                m1_speed = m2_speed = 1.0  # Full speed (0-1.0 scale)
+            elif state == 'REVERSING_FROM_OPEN':
                 # Was opening, now reverse (close direction)
-                self.motor1.backward(1.0)
-                self.motor2.backward(1.0)
-                self.shared['m1_speed'] = 1.0  # Full speed (0-1.0 scale)
-                self.shared['m2_speed'] = 1.0
-            return
-        
-        if not self.shared['movement_start_time'] or self.shared['opening_paused']:
-            self.motor1.stop()
-            self.motor2.stop()
-            self.shared['m1_speed'] = 0.0
-            self.shared['m2_speed'] = 0.0
-            return
-        
-        ramp_time = self.ramp_time
-        
-        if self.shared['opening_paused']:
-            self.motor1.stop()
-            self.motor2.stop()
-            self.shared['m1_speed'] = 0
-            self.shared['m2_speed'] = 0
-            return
-        
-        # Motor 1
-        m1_move_start = self.shared.get('m1_move_start')
-        if m1_move_start:
-            elapsed = now - m1_move_start
-
-            # Check if we should ignore position limits for speed calculation
-            # When using limit switches, we don't decelerate based on position
-            ignore_position_limits = (self.shared.get('learning_mode_enabled', False) and
-                                     self.motor1_use_limit_switches) or self.motor1_use_limit_switches
-
-            if ignore_position_limits:
-                # When ignoring position limits, only ramp up based on time, no deceleration
-                # Use a large remaining value to prevent deceleration in _calculate_ramp_speed
-                remaining = 999.0  # Large value ensures no deceleration
-                speed = self._calculate_ramp_speed(elapsed, remaining, ramp_time)
-                speed = max(0.0, min(1.0, speed))
-            else:
-                # Normal position-based speed calculation
-                if self.shared['state'] == 'OPENING_TO_PARTIAL_1':
-                    remaining = self.partial_1_position - self.shared['m1_position']
-                elif self.shared['state'] == 'OPENING_TO_PARTIAL_2':
-                    remaining = self.partial_2_position - self.shared['m1_position']
-                elif self.shared['state'] == 'CLOSING_TO_PARTIAL_1':
-                    remaining = self.shared['m1_position'] - self.partial_1_position
-                elif self.shared['state'] == 'CLOSING_TO_PARTIAL_2':
-                    remaining = self.shared['m1_position'] - self.partial_2_position
-                else:
-                    remaining = self.motor1_run_time - self.shared['m1_position'] if self.shared['movement_command'] == 'OPEN' else self.shared['m1_position']
+                self._set_motor(self.motor1, 1.0, 'backward')
+                self._set_motor(self.motor2, 1.0, 'backward')
+                m1_speed = m2_speed = 1.0  # Full speed (0-1.0 scale)
+        elif not s['movement_start_time'] or s['opening_paused']:
+            self._set_motor(self.motor1, 0.0, 'stop')
+            self._set_motor(self.motor2, 0.0, 'stop')
+            m1_speed = m2_speed = 0.0
+        else:
+            command = s['movement_command']
+            learning_mode = s.get('learning_mode_enabled', False)
+            ramp_time = self.ramp_time
+            inv_ramp_time = self._inv_ramp_time
+            # Post-resume ramp is the same for both motors - evaluate it once
+            resume_ramp = self._resume_ramp(now, s['resume_time'])
+
+            # Motor 1
+            m1_move_start = s.get('m1_move_start')
+            if m1_move_start:
+                elapsed = now - m1_move_start
 
-                remaining = max(0, remaining)
-                speed = self._calculate_ramp_speed(elapsed, remaining, ramp_time)
-                speed = max(0.0, min(1.0, speed))
+                # Check if we should ignore position limits for speed calculation
+                # When using limit switches, we don't decelerate based on position
+                ignore_position_limits = (learning_mode and self.motor1_use_limit_switches) or self.motor1_use_limit_switches
 
-            # Apply learning speed if in learning mode
-            if self.shared.get('learning_mode_enabled', False):
-                speed = min(speed, self.learning_speed)
-            else:
-                # Apply user-configurable speed and gradual slowdown for limit switches
-                if self.shared['movement_command'] == 'OPEN':
-                    # Apply user's open speed
-                    max_speed = self.open_speed
-                    speed = speed * max_speed
-
-                    # Apply gradual slowdown ONLY when approaching OPEN limit (not partial positions)
-                    if (self.motor1_use_limit_switches and self.motor1_run_time and
-                        self.shared['state'] not in ['OPENING_TO_PARTIAL_1', 'OPENING_TO_PARTIAL_2']):
-                        remaining_distance = self.motor1_run_time - self.shared['m1_position']
-                        # Debug: Show slowdown call
-                        # (Commented out to reduce log spam - uncomment for debugging)
-                        # if not hasattr(self, '_slowdown_debug_open') or (time() - self._slowdown_debug_open) > 0.5:
-                        #     print(f"[M1 OPEN SLOWDOWN CALL] pos={self.shared['m1_position']:.2f}, remaining={remaining_distance:.2f}, "
-                        #           f"run_time={self.motor1_run_time:.2f}, speed_before={speed:.3f}")
-                        #     self._slowdown_debug_open = time()
-                        speed = self._apply_gradual_slowdown(speed, remaining_distance, max_speed, True, 'OPEN', self.motor1_run_time)
-
-                elif self.shared['movement_command'] == 'CLOSE':
-                    # Apply user's close speed
-                    max_speed = self.close_speed
-                    speed = speed * max_speed
-
-                    # Apply gradual slowdown ONLY when approaching CLOSE limit (not partial positions)
-                    if (self.motor1_use_limit_switches and self.motor1_run_time and
-                        self.shared['state'] not in ['CLOSING_TO_PARTIAL_1', 'CLOSING_TO_PARTIAL_2']):
-                        remaining_distance = self.shared['m1_position']
-                        # Debug: Show slowdown call
-                        # (Commented out to reduce log spam - uncomment for debugging)
-                        # if not hasattr(self, '_slowdown_debug_close') or (time() - self._slowdown_debug_close) > 0.5:
-                        #     print(f"[M1 CLOSE SLOWDOWN CALL] pos={self.shared['m1_position']:.2f}, remaining={remaining_distance:.2f}, "
-                        #           f"run_time={self.motor1_run_time:.2f}, speed_before={speed:.3f}")
-                        #     self._slowdown_debug_close = time()
-                        speed = self._apply_gradual_slowdown(speed, remaining_distance, max_speed, True, 'CLOSE', self.motor1_run_time)
-
-            self.shared['m1_speed'] = speed
-
-            # Check if we should ignore position limits and keep running until limit switch
-            # This applies in two cases:
-            # 1. Learning mode with limit switches enabled
-            # 2. Normal mode with limit switches enabled (must creep to find limits!)
-            ignore_position_limits = (self.shared.get('learning_mode_enabled', False) and
-                                     self.motor1_use_limit_switches) or self.motor1_use_limit_switches
-
-            if self.shared['state'] in ['OPENING', 'OPENING_TO_PARTIAL_1', 'OPENING_TO_PARTIAL_2']:
-                # Use M1's actual run time (learned if available, else configured)
-                target_position = self.motor1_run_time
-                if self.shared['state'] == 'OPENING_TO_PARTIAL_1':
-                    target_position = self.partial_1_position
-                elif self.shared['state'] == 'OPENING_TO_PARTIAL_2':
-                    target_position = self.partial_2_position
-
-                # When limit switches enabled, keep running until limit triggers (with safety margin)
-                # Fault detection prevents infinite running if limit switch fails
                 if ignore_position_limits:
-                    # Perform fault checks
-                    open_limit_m1 = self.shared.get('open_limit_m1_active', False)
-                    close_limit_m1 = self.shared.get('close_limit_m1_active', False)
-
-                    # Check for over-travel (150% threshold)
-                    if self._check_over_travel(1, self.shared['m1_position'], target_position, "OPENING"):
-                        self.motor1.stop()
-                        self.shared['m1_speed'] = 0.0  # Reset speed to 0 when stopped
-                    # Check limit release at 50% travel
-                    elif self._check_limit_release(1, self.shared['m1_position'], target_position, "OPENING", close_limit_m1):
-                        self.motor1.forward(speed)  # Continue but fault is logged
-                    # Check limit activation at expected position
-                    elif self._check_limit_activation(1, self.shared['m1_position'], target_position, "OPENING",
-                                                      open_limit_m1, close_limit_m1, close_limit_m1, open_limit_m1):
-                        self.motor1.forward(speed)  # Continue but fault is logged
-                    # Normal operation - keep running until limit hits
-                    elif not open_limit_m1:
-                        self.motor1.forward(speed)
-                    else:
-                        # Successfully hit limit
-                        self.motor1.stop()
+                    # When ignoring position limits, only ramp up based on time, no deceleration
+                    # Use a large remaining value to prevent deceleration in calculate_ramp_speed
+                    remaining = 999.0  # Large value ensures no deceleration
+                elif state in self.m1_open_targets:
+                    # Normal position-based speed calculation
+                    remaining = max(0, self.m1_open_targets[state] - m1p)
+                elif state in self.m1_close_targets:
+                    remaining = max(0, m1p - self.m1_close_targets[state])
                 else:
-                    # Normal position-based stopping
-                    # Use small tolerance to avoid floating point precision issues
-                    position_tolerance = 0.05  # One control loop cycle
-                    if self.shared['m1_position'] < target_position - position_tolerance:
-                        self.motor1.forward(speed)
-                    else:
-                        self.motor1.stop()
-                        # Snap to exact target when stopped
-                        # DISABLED - too much spam
-                        # if abs(self.shared['m1_position'] - target_position) > 0.01:
-                        #     print(f"[MOTOR MGR] Snapping M1: {self.shared['m1_position']:.10f} -> {target_position}")
-                        self.shared['m1_position'] = target_position
-            else:
-                target_position = 0
-                if self.shared['state'] == 'CLOSING_TO_PARTIAL_1':
-                    target_position = self.partial_1_position
-                elif self.shared['state'] == 'CLOSING_TO_PARTIAL_2':
-                    target_position = self.partial_2_position
-
-                # Partial positions don't have limit switches - always use position-based stopping
-                # Only ignore position limits when closing to FULL close (state = 'CLOSING')
-                # CRITICAL: Use limit switch mode ONLY for full close operations when limit switches enabled
-                #           This ensures motors continue to limits regardless of position tracking
-                use_limit_switch_mode = (ignore_position_limits and
-                                        self.shared['state'] == 'CLOSING')  # Only full close, not partial
-
-                # DEBUG: Show motor control decisions for M1 closing
-                # DISABLED - too much spam
-                # if self.shared['movement_command'] == 'CLOSE':
-                #     print(f"[M1 MOTOR] State={self.shared['state']} Pos={self.shared['m1_position']:.1f} Target={target_position:.1f} LimitMode={use_limit_switch_mode} IgnoreLimits={ignore_position_limits}")
-
-                # When limit switches enabled, keep running until limit triggers (with fault detection)
-                if use_limit_switch_mode:
-                    # Perform fault checks
-                    open_limit_m1 = self.shared.get('open_limit_m1_active', False)
-                    close_limit_m1 = self.shared.get('close_limit_m1_active', False)
-
-                    # For closing, position goes from motor1_run_time down to 0 (and can go negative with limit switches)
-                    # Check for excessive over-travel (safety threshold at -50% of expected travel)
-                    # This prevents runaway if limit switch fails
-                    over_travel_threshold = -0.5 * self.motor1_run_time  # -50% of run time
-                    if self.shared['m1_position'] < over_travel_threshold:
-                        self._record_fault(1, "OVER_TRAVEL", f"CLOSING - position {self.shared['m1_position']:.2f}s below {over_travel_threshold:.2f}s (excessive overtravel)")
-                        self.motor1.stop()
-                        self.shared['m1_speed'] = 0.0  # Reset speed to 0 when stopped
-                    # Check limit release - at 50% travel from open, open limit should be off
-                    elif self._check_limit_release(1, self.motor1_run_time - self.shared['m1_position'],
-                                                   self.motor1_run_time, "CLOSING", open_limit_m1):
-                        self.motor1.backward(speed)  # Continue but fault is logged
-                    # Check limit activation at expected position
-                    elif self.shared['m1_position'] <= 0.1 and not close_limit_m1:
-                        # Near zero but close limit not active
-                        if open_limit_m1:
-                            self._record_fault(1, "LIMIT_MISSING", "CLOSING - close limit not activated, open still active")
-                        else:
-                            self._record_fault(1, "LIMIT_MISSING", "CLOSING - close limit not activated at position 0")
-                        self.motor1.backward(speed)  # Continue but fault is logged
-                    # Normal operation - keep running until limit hits
-                    elif not close_limit_m1:
-                        self.motor1.backward(speed)
+                    remaining = max(0, self.motor1_run_time - m1p if command == 'OPEN' else m1p)
+                speed = calculate_ramp_speed(elapsed, remaining, ramp_time, inv_ramp_time, resume_ramp)
+
+                # Apply learning speed if in learning mode
+                if learning_mode:
+                    speed = min(speed, self.learning_speed)
+                else:
+                    # Apply user-configurable speed and gradual slowdown for limit switches
+                    if command == 'OPEN':
+                        # Apply user's open speed
+                        max_speed = self.open_speed
+                        speed = speed * max_speed
+
+                        # Apply gradual slowdown ONLY when approaching OPEN limit (not partial positions)
+                        if (self.motor1_use_limit_switches and self.motor1_run_time and
+                            state not in PARTIAL_OPEN_STATES):
+                            remaining_distance = self.motor1_run_time - m1p
+                            speed = self._apply_gradual_slowdown(speed, remaining_distance, max_speed, True, 'OPEN', self.motor1_run_time)
+
+                    elif command == 'CLOSE':
+                        # Apply user's close speed
+                        max_speed = self.close_speed
+                        speed = speed * max_speed
+
+                        # Apply gradual slowdown ONLY when approaching CLOSE limit (not partial positions)
+                        if (self.motor1_use_limit_switches and self.motor1_run_time and
+                            state not in PARTIAL_CLOSE_STATES):
+                            remaining_distance = m1p
+                            speed = self._apply_gradual_slowdown(speed, remaining_distance, max_speed, True, 'CLOSE', self.motor1_run_time)
+
+                m1_speed = speed
+
+                if state in OPENING_STATES:
+                    # Use M1's actual run time (learned if available, else configured)
+                    target_position = self.m1_open_targets.get(state, self.motor1_run_time)
+
+                    # When limit switches enabled, keep running until limit triggers (with safety margin)
+                    # Fault detection prevents infinite running if limit switch fails
+                    if ignore_position_limits:
+                        m1_speed = self._drive_to_open_limit(1, self.motor1, m1p, target_position, speed,
+                                                             s.get('open_limit_m1_active', False),
+                                                             s.get('close_limit_m1_active', False))
                     else:
-                        # Successfully hit limit
-                        self._clear_fault(1)
-                        self.motor1.stop()
+                        m1p = self._drive_to_position(self.motor1, m1p, target_position, speed, 1)
                 else:
-                    # Normal position-based stopping
-                    # Use small tolerance to avoid floating point precision issues
-                    position_tolerance = 0.05  # One control loop cycle
-                    if self.shared['m1_position'] > target_position + position_tolerance:
-                        self.motor1.backward(speed)
-                        # DISABLED - too much spam
-                        # if self.shared['movement_command'] == 'CLOSE':
-                        #     print(f"[M1 MOTOR] Running: Pos {self.shared['m1_position']:.2f} > Target {target_position:.2f} (+{position_tolerance})")
+                    target_position = self.m1_close_targets.get(state, 0)
+
+                    # Partial positions don't have limit switches - always use position-based stopping
+                    # Only ignore position limits when closing to FULL close (state = 'CLOSING')
+                    # CRITICAL: Use limit switch mode ONLY for full close operations when limit switches enabled
+                    #           This ensures motors continue to limits regardless of position tracking
+                    use_limit_switch_mode = (ignore_position_limits and
+                                            state == 'CLOSING')  # Only full close, not partial
+
+                    # When limit switches enabled, keep running until limit triggers (with fault detection)
+                    if use_limit_switch_mode:
+                        m1_speed = self._drive_to_close_limit(1, self.motor1, m1p, self.motor1_run_time, speed,
+                                                              s.get('open_limit_m1_active', False),
+                                                              s.get('close_limit_m1_active', False))
                     else:
-                        self.motor1.stop()
-                        # DISABLED - too much spam
-                        # if self.shared['movement_command'] == 'CLOSE':
-                        #     print(f"[M1 MOTOR] STOPPED: Pos {self.shared['m1_position']:.2f} <= Target {target_position:.2f} (+{position_tolerance})")
-                        # Snap to exact target when stopped
-                        self.shared['m1_position'] = target_position
-        else:
-            # No move command - ensure motor is stopped
-            self.motor1.stop()
-            self.shared['m1_speed'] = 0.0
-        
-        # Motor 2 (skip if disabled)
-        m2_move_start = self.shared.get('m2_move_start')
-        if self.motor2_enabled and m2_move_start:
-            elapsed = now - m2_move_start
-
-            # Check if we should ignore position limits for speed calculation
-            # When using limit switches, we don't decelerate based on position
-            ignore_position_limits_m2 = (self.shared.get('learning_mode_enabled', False) and
-                                        self.motor2_use_limit_switches) or self.motor2_use_limit_switches
-
-            if ignore_position_limits_m2:
-                # When ignoring position limits, only ramp up based on time, no deceleration
-                # Use a large remaining value to prevent deceleration in _calculate_ramp_speed
-                remaining = 999.0  # Large value ensures no deceleration
-                speed = self._calculate_ramp_speed(elapsed, remaining, ramp_time)
-                speed = max(0.0, min(1.0, speed))
+                        m1p = self._drive_to_position(self.motor1, m1p, target_position, speed, -1)
             else:
-                # Normal position-based speed calculation
-                remaining = self.motor2_run_time - self.shared['m2_position'] if self.shared['movement_command'] == 'OPEN' else self.shared['m2_position']
-                remaining = max(0, remaining)
+                # No move command - ensure motor is stopped
+                self._set_motor(self.motor1, 0.0, 'stop')
+                m1_speed = 0.0
 
-                speed = self._calculate_ramp_speed(elapsed, remaining, ramp_time)
-                speed = max(0.0, min(1.0, speed))
+            # Motor 2 (skip if disabled)
+            m2_move_start = s.get('m2_move_start')
+            if self.motor2_enabled and m2_move_start:
+                elapsed = now - m2_move_start
+
+                # Check if we should ignore position limits for speed calculation
+                # When using limit switches, we don't decelerate based on position
+                ignore_position_limits_m2 = (learning_mode and self.motor2_use_limit_switches) or self.motor2_use_limit_switches
 
-            # Apply learning speed if in learning mode
-            if self.shared.get('learning_mode_enabled', False):
-                speed = min(speed, self.learning_speed)
-            else:
-                # Apply user-configurable speed and gradual slowdown for limit switches
-                if self.shared['movement_command'] == 'OPEN':
-                    # Apply user's open speed
-                    max_speed = self.open_speed
-                    speed = speed * max_speed
-
-                    # Apply gradual slowdown when approaching open limit (M2 has no partial positions)
-                    if self.motor2_use_limit_switches and self.motor2_run_time:
-                        remaining_distance = self.motor2_run_time - self.shared['m2_position']
-                        speed = self._apply_gradual_slowdown(speed, remaining_distance, max_speed, True, 'OPEN', self.motor2_run_time)
-
-                elif self.shared['movement_command'] == 'CLOSE':
-                    # Apply user's close speed
-                    max_speed = self.close_speed
-                    speed = speed * max_speed
-
-                    # Apply gradual slowdown when approaching close limit (M2 has no partial positions)
-                    if self.motor2_use_limit_switches and self.motor2_run_time:
-                        remaining_distance = self.shared['m2_position']
-                        speed = self._apply_gradual_slowdown(speed, remaining_distance, max_speed, True, 'CLOSE', self.motor2_run_time)
-
-            self.shared['m2_speed'] = speed
-
-            if self.shared['movement_command'] == 'OPEN':
-                # When limit switches enabled, keep running until limit triggers (with fault detection)
                 if ignore_position_limits_m2:
-                    # Perform fault checks
-                    open_limit_m2 = self.shared.get('open_limit_m2_active', False)
-                    close_limit_m2 = self.shared.get('close_limit_m2_active', False)
-
-                    # Check for over-travel (150% threshold)
-                    if self._check_over_travel(2, self.shared['m2_position'], self.motor2_run_time, "OPENING"):
-                        self.motor2.stop()
-                        self.shared['m2_speed'] = 0.0  # Reset speed to 0 when stopped
-                    # Check limit release at 50% travel
-                    elif self._check_limit_release(2, self.shared['m2_position'], self.motor2_run_time, "OPENING", close_limit_m2):
-                        self.motor2.forward(speed)  # Continue but fault is logged
-                    # Check limit activation at expected position
-                    elif self._check_limit_activation(2, self.shared['m2_position'], self.motor2_run_time, "OPENING",
-                                                      open_limit_m2, close_limit_m2, close_limit_m2, open_limit_m2):
-                        self.motor2.forward(speed)  # Continue but fault is logged
-                    # Normal operation - keep running until limit hits
-                    elif not open_limit_m2:
-                        self.motor2.forward(speed)
-                    else:
-                        # Successfully hit limit
-                        self.motor2.stop()
+                    # When ignoring position limits, only ramp up based on time, no deceleration
+                    # Use a large remaining value to prevent deceleration in calculate_ramp_speed
+                    remaining = 999.0  # Large value ensures no deceleration
                 else:
-                    # Normal position-based stopping (use M2's actual run time)
-                    # Use small tolerance to avoid floating point precision issues
-                    position_tolerance = 0.05  # One control loop cycle
-                    if self.shared['m2_position'] < self.motor2_run_time - position_tolerance:
-                        self.motor2.forward(speed)
-                    else:
-                        self.motor2.stop()
-                        # Snap to exact target when stopped
-                        # DISABLED - too much spam
-                        # if abs(self.shared['m2_position'] - self.motor2_run_time) > 0.01:
-                        #     print(f"[MOTOR MGR] Snapping M2: {self.shared['m2_position']:.10f} -> {self.motor2_run_time}")
-                        self.shared['m2_position'] = self.motor2_run_time
-            else:
-                # When limit switches enabled, keep running until limit triggers (with fault detection)
-                if ignore_position_limits_m2:
-                    # Perform fault checks
-                    open_limit_m2 = self.shared.get('open_limit_m2_active', False)
-                    close_limit_m2 = self.shared.get('close_limit_m2_active', False)
-
-                    # For closing, position goes from motor2_run_time down to 0 (and can go negative with limit switches)
-                    # Check for excessive over-travel (safety threshold at -50% of expected travel)
-                    # This prevents runaway if limit switch fails
-                    over_travel_threshold = -0.5 * self.motor2_run_time  # -50% of run time
-                    if self.shared['m2_position'] < over_travel_threshold:
-                        self._record_fault(2, "OVER_TRAVEL", f"CLOSING - position {self.shared['m2_position']:.2f}s below {over_travel_threshold:.2f}s (excessive overtravel)")
-                        self.motor2.stop()
-                        self.shared['m2_speed'] = 0.0  # Reset speed to 0 when stopped
-                    # Check limit release - at 50% travel from open, open limit should be off
-                    elif self._check_limit_release(2, self.motor2_run_time - self.shared['m2_position'],
-                                                   self.motor2_run_time, "CLOSING", open_limit_m2):
-                        self.motor2.backward(speed)  # Continue but fault is logged
-                    # Check limit activation at expected position
-                    elif self.shared['m2_position'] <= 0.1 and not close_limit_m2:
-                        # Near zero but close limit not active
-                        if open_limit_m2:
-                            self._record_fault(2, "LIMIT_MISSING", "CLOSING - close limit not activated, open still active")
-                        else:
-                            self._record_fault(2, "LIMIT_MISSING", "CLOSING - close limit not activated at position 0")
-                        self.motor2.backward(speed)  # Continue but fault is logged
-                    # Normal operation - keep running until limit hits
-                    elif not close_limit_m2:
-                        self.motor2.backward(speed)
+                    # Normal position-based speed calculation
+                    remaining = max(0, self.motor2_run_time - m2p if command == 'OPEN' else m2p)
+                speed = calculate_ramp_speed(elapsed, remaining, ramp_time, inv_ramp_time, resume_ramp)
+
+                # Apply learning speed if in learning mode
+                if learning_mode:
+                    speed = min(speed, self.learning_speed)
+                else:
+                    # Apply user-configurable speed and gradual slowdown for limit switches
+                    if command == 'OPEN':
+                        # Apply user's open speed
+                        max_speed = self.open_speed
+                        speed = speed * max_speed
+
+                        # Apply gradual slowdown when approaching open limit (M2 has no partial positions)
+                        if self.motor2_use_limit_switches and self.motor2_run_time:
+                            remaining_distance = self.motor2_run_time - m2p
+                            speed = self._apply_gradual_slowdown(speed, remaining_distance, max_speed, True, 'OPEN', self.motor2_run_time)
+
+                    elif command == 'CLOSE':
+                        # Apply user's close speed
+                        max_speed = self.close_speed
+                        speed = speed * max_speed
+
+                        # Apply gradual slowdown when approaching close limit (M2 has no partial positions)
+                        if self.motor2_use_limit_switches and self.motor2_run_time:
+                            remaining_distance = m2p
+                            speed = self._apply_gradual_slowdown(speed, remaining_distance, max_speed, True, 'CLOSE', self.motor2_run_time)
+
+                m2_speed = speed
+
+                if command == 'OPEN':
+                    # When limit switches enabled, keep running until limit triggers (with fault detection)
+                    if ignore_position_limits_m2:
+                        m2_speed = self._drive_to_open_limit(2, self.motor2, m2p, self.motor2_run_time, speed,
+                                                             s.get('open_limit_m2_active', False),
+                                                             s.get('close_limit_m2_active', False))
                     else:
-                        # Successfully hit limit
-                        self._clear_fault(2)
-                        self.motor2.stop()
+                        # Normal position-based stopping (use M2's actual run time)
+                        m2p = self._drive_to_position(self.motor2, m2p, self.motor2_run_time, speed, 1)
                 else:
-                    # Normal position-based stopping
-                    # Use small tolerance to avoid floating point precision issues
-                    position_tolerance = 0.05  # One control loop cycle
-                    if self.shared['m2_position'] > position_tolerance:
-                        self.motor2.backward(speed)
+                    # When limit switches enabled, keep running until limit triggers (with fault detection)
+                    if ignore_position_limits_m2:
+                        m2_speed = self._drive_to_close_limit(2, self.motor2, m2p, self.motor2_run_time, speed,
+                                                              s.get('open_limit_m2_active', False),
+                                                              s.get('close_limit_m2_active', False))
                     else:
-                        self.motor2.stop()
-                        # Snap to exact target when stopped
-                        self.shared['m2_position'] = 0
-        elif self.motor2_enabled:
-            # No move command - ensure motor is stopped
-            self.motor2.stop()
-            self.shared['m2_speed'] = 0.0
-
-        # If motor2 disabled, ensure it's always stopped
-        if not self.motor2_enabled:
-            self.motor2.stop()
-            self.shared['m2_speed'] = 0.0
-            self.shared['m2_position'] = 0.0
-    
-    def _calculate_ramp_speed(self, elapsed, remaining, ramp_time):
-        """Calculate speed with acceleration and deceleration"""
-        if self.shared['resume_time'] and (time() - self.shared['resume_time']) < 0.5:
-            time_since_resume = time() - self.shared['resume_time']
-            return max(0.0, min(1.0, time_since_resume / 0.5))
-
-        if elapsed < ramp_time:
-            return min(1.0, elapsed / ramp_time)
-        elif remaining < ramp_time:
-            return max(0.0, min(1.0, remaining / ramp_time))
-        else:
-            return 1.0
+                        m2p = self._drive_to_position(self.motor2, m2p, 0, speed, -1)
+            elif self.motor2_enabled:
+                # No move command - ensure motor is stopped
+                self._set_motor(self.motor2, 0.0, 'stop')
+                m2_speed = 0.0
+
+            # If motor2 disabled, ensure it's always stopped
+            if not self.motor2_enabled:
+                self._set_motor(self.motor2, 0.0, 'stop')
+                m2_speed = 0.0
+                m2p = 0.0
+
+            # Update positions using the speed set above so tracking matches
+            # actual motor movement
+            if command == 'OPEN':
+                # Motor 1 position update
+                if m1_move_start:
+                    # Target depends on state - full open uses M1's actual run time
+                    target_position = self.m1_open_targets.get(state, self.motor1_run_time)
+
+                    # Only update position if motor is actually running (speed > 0)
+                    # This prevents position from incrementing when motor is stopped
+                    # Speed already includes all multipliers and slowdown from above
+                    speed = m1_speed
+                    if speed > 0:
+                        if self.motor1_use_limit_switches and state == 'OPENING':
+                            # With limit switches: allow position to go beyond target until limit hit
+                            m1p = self._integrate_position(m1p, speed, 1)
+                        else:
+                            # Without limit switches: clamp to target position
+                            m1p = self._integrate_position(m1p, speed, 1, target_position)
+
+                # Motor 2 position update
+                if m2_move_start:
+                    speed = m2_speed
+                    if speed > 0:
+                        if self.motor2_use_limit_switches:
+                            # With limit switches: allow position to go beyond target until limit hit
+                            m2p = self._integrate_position(m2p, speed, 1)
+                        else:
+                            # Without limit switches: clamp to target position
+                            m2p = self._integrate_position(m2p, speed, 1, self.motor2_run_time)
+                elif (m1_move_start and
+                      (now - s['movement_start_time']) >= self.motor1_open_delay and
+                      state not in PARTIAL_OPEN_STATES):
+                    s['m2_move_start'] = now
+                    s['m2_target'] = m2p
+
+            elif command == 'CLOSE':
+                # Motor 2 position update (closes first)
+                if m2_move_start:
+                    speed = m2_speed
+                    if speed > 0:
+                        if self.motor2_use_limit_switches:
+                            # With limit switches: allow position to go negative until limit hit
+                            m2p = self._integrate_position(m2p, speed, -1)
+                        else:
+                            # Without limit switches: clamp to zero
+                            m2p = self._integrate_position(m2p, speed, -1, 0)
+
+                # Motor 1 position update
+                if m1_move_start:
+                    # Target depends on state - full close is position 0
+                    target_position = self.m1_close_targets.get(state, 0)
+
+                    speed = m1_speed
+                    if speed > 0:
+                        if self.motor1_use_limit_switches and state == 'CLOSING':
+                            # With limit switches: allow position to go negative until limit hit
+                            m1p = self._integrate_position(m1p, speed, -1)
+                        else:
+                            # Without limit switches: clamp to target position
+                            m1p = self._integrate_position(m1p, speed, -1, target_position)
+                elif (m2_move_start and
+                      (now - s['movement_start_time']) >= (0 if not self.motor2_enabled else self.motor2_close_delay)):
+                    # Start M1 after delay for ALL closing operations (including partial)
+                    # Skip delay if motor2 is disabled
+                    # Only exclude if we're moving FROM a partial position (not returning from OPEN)
+                    if not (state in PARTIAL_CLOSE_STATES and
+                            not s.get('returning_from_full_open', False)):
+                        s['m1_move_start'] = now
+                        s['m1_target'] = m1p
+
+        # Write back only what changed
+        if m1_speed != m1_speed_in:
+            s['m1_speed'] = m1_speed
+        if m2_speed != m2_speed_in:
+            s['m2_speed'] = m2_speed
+        if m1p != m1p_in:
+            s['m1_position'] = m1p
+        if m2p != m2p_in:
+            s['m2_position'] = m2p
+
+    def _resume_ramp(self, now, resume_time):
+        """Speed during the 0.5s ramp after resuming from pause, or None outside it"""
+        if resume_time:
+            time_since_resume = now - resume_time
+            if time_since_resume < 0.5:
+                return max(0.0, min(1.0, time_since_resume * 2.0))  # / 0.5s
+        return None
 
     def _apply_gradual_slowdown(self, speed, remaining_distance, max_speed, use_limit_switches, direction, motor_run_time):
         """
@@ -1806,27 +1933,71 @@ class MotorManager:
         speed_range = max_speed - self.limit_switch_creep_speed
         target_speed = self.limit_switch_creep_speed + (speed_range * (remaining_distance / slowdown_distance))
 
-        # DEBUG: Log slowdown details every 0.5s
-        now = time()
-        if not hasattr(self, '_last_slowdown_log'):
-            self._last_slowdown_log = {}
-
-        # Debug: Show slowdown calculation details
-        # (Commented out to reduce log spam - uncomment for debugging)
-        # key = f"{direction}_slowdown"
-        # if key not in self._last_slowdown_log or (now - self._last_slowdown_log[key]) > 0.5:
-        #     print(f"[SLOWDOWN {direction}] motor_run_time={motor_run_time:.2f}s, percent={percent:.1f}%, "
-        #           f"slowdown_zone={slowdown_distance:.2f}s, remaining={remaining_distance:.2f}s, "
-        #           f"target_speed={target_speed:.2f}, ramp_speed={speed:.2f}, final={min(speed, target_speed):.2f}")
-        #     self._last_slowdown_log[key] = now
-        pass
+        # Debug: Show slowdown calculation details every 0.5s (config 'motor_debug')
+        if self.debug:
+            now = monotonic()
+            key = f"{direction}_slowdown"
+            if now - self._last_slowdown_log.get(key, 0.0) > 0.5:
+                print(f"[SLOWDOWN {direction}] motor_run_time={motor_run_time:.2f}s, percent={percent:.1f}%, "
+                      f"slowdown_zone={slowdown_distance:.2f}s, remaining={remaining_distance:.2f}s, "
+                      f"target_speed={target_speed:.2f}, ramp_speed={speed:.2f}, final={min(speed, target_speed):.2f}")
+                self._last_slowdown_log[key] = now
 
         # Use minimum of ramp speed and slowdown target
         # This ensures we don't speed up during slowdown
         return min(speed, target_speed)
 
 
-def motor_manager_process(shared_dict, config):
+def _apply_realtime_settings(config):
+    """Best-effort real-time setup for the motor control process.
+
+    - Pin to a dedicated CPU (config 'motor_cpu') so other processes and IRQs
+      on the same core can't preempt the loop. Pair with kernel boot args in
+      /boot/firmware/cmdline.txt, e.g. for CPU 3:  isolcpus=3 nohz_full=3 rcu_nocbs=3
+    - mlockall() so the loop never takes a page fault - opt-in via
+      'motor_mlock' (default off). MCL_CURRENT faults in and un-shares the whole
+      copy-on-write heap inherited from the parent, roughly doubling RSS. Only
+      attempted when memlock is unlimited/root - MCL_FUTURE under a small
+      RLIMIT_MEMLOCK makes later allocations fail.
+    - SCHED_FIFO at 'motor_rt_priority' - opt-in, default 0 (normal
+      scheduling). Keep it moderate (e.g. 50): the loop depends on the Manager
+      server process for every shared-dict access, and that runs at normal
+      priority. Needs root or CAP_SYS_NICE; a PREEMPT_RT kernel gives the best
+      wakeup latency.
+
+    Each step is independent - failures are reported and the process carries
+    on with normal scheduling.
+    """
+    cpu = config.get('motor_cpu')
+    if cpu is not None:
+        try:
+            os.sched_setaffinity(0, {int(cpu)})
+            print(f"Motor Manager: pinned to CPU {cpu}")
+        except (OSError, ValueError) as e:
+            print(f"Motor Manager: WARNING - could not pin to CPU {cpu}: {e}")
+
+    if config.get('motor_mlock', False):
+        try:
+            memlock = resource.getrlimit(resource.RLIMIT_MEMLOCK)[0]
+            if os.geteuid() == 0 or memlock == resource.RLIM_INFINITY:
+                libc = ctypes.CDLL("libc.so.6", use_errno=True)
+                if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+                    raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+                print("Motor Manager: memory locked")
+        except OSError as e:
+            print(f"Motor Manager: WARNING - mlockall failed: {e}")
+
+    priority = config.get('motor_rt_priority', 0)
+    if priority:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            print(f"Motor Manager: SCHED_FIFO priority {priority}")
+        except (OSError, AttributeError) as e:
+            print(f"Motor Manager: WARNING - could not set SCHED_FIFO: {e} (running with normal scheduling)")
+
+
+def motor_manager_process(shared_dict, config, wake_event=None, telemetry=None):
     """Entry point for motor manager process"""
-    manager = MotorManager(shared_dict, config)
+    _apply_realtime_settings(config)
+    manager = MotorManager(shared_dict, config, wake_event, telemetry)
     manager.run()
@@ -1,7 +1,10 @@
 # webui.py - Enhanced Web UI for Gate Controller
-import json, pathlib, asyncio, time
+import json, pathlib, asyncio, time, hashlib, gzip, traceback, sys, threading
+from math import isfinite
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.websockets import WebSocket
 import uvicorn
@@ -9,7 +12,27 @@ import uvicorn
 from gate_controller_v2 import GateController
 import os
 
-app = FastAPI()
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+except ImportError:
+    print("WARNING: orjson not installed - web UI will use stdlib json (slower)")
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # gzip only - brotli is optional for the index page
+
+@asynccontextmanager
+async def lifespan(app):
+    """Run the /ws broadcaster for the life of the server"""
+    task = asyncio.create_task(_broadcaster())
+    yield
+    task.cancel()
+
+app = FastAPI(default_response_class=ORJSONResponse if orjson else JSONResponse,
+              lifespan=lifespan)
 controller = GateController()  # uses same shared dict/logic
 
 # Use environment variable or default paths
@@ -94,27 +117,27 @@ INDEX = """<!doctype html><meta charset="utf-8">
     </div>
 
     <div class="row">
-      <button id="btnOpen" class="green" onclick="toggle('cmd_open_active')">OPEN</button>
-      <button id="btnStop" class="red" onclick="toggle('cmd_stop_active')">STOP</button>
-      <button id="btnClose" class="blue" onclick="toggle('cmd_close_active')">CLOSE</button>
+      <button id="btnOpen" class="green" data-key="cmd_open_active">OPEN</button>
+      <button id="btnStop" class="red" data-key="cmd_stop_active">STOP</button>
+      <button id="btnClose" class="blue" data-key="cmd_close_active">CLOSE</button>
     </div>
 
     <div class="row small">
-      <button id="btnPClose" class="yellow" onclick="toggle('photocell_closing_active')">CLOSING PHOTO</button>
-      <button id="btnPOpen" class="orange" onclick="toggle('photocell_opening_active')">OPENING PHOTO</button>
-      <button id="btnPO1" class="purple" onclick="toggle('partial_1_active')">PO1</button>
-      <button id="btnPO2" class="violet" onclick="toggle('partial_2_active')">PO2</button>
+      <button id="btnPClose" class="yellow" data-key="photocell_closing_active">CLOSING PHOTO</button>
+      <button id="btnPOpen" class="orange" data-key="photocell_opening_active">OPENING PHOTO</button>
+      <button id="btnPO1" class="purple" data-key="partial_1_active">PO1</button>
+      <button id="btnPO2" class="violet" data-key="partial_2_active">PO2</button>
     </div>
 
     <div class="row small">
-      <button id="btnSC" class="red" onclick="toggle('safety_stop_closing_active')">STOP CLOSING</button>
-      <button id="btnSO" class="red" onclick="toggle('safety_stop_opening_active')">STOP OPENING</button>
-      <button id="btnDMO" class="lightgreen" onclick="toggle('deadman_open_active')">DEADMAN OPEN</button>
-      <button id="btnDMC" class="lightblue" onclick="toggle('deadman_close_active')">DEADMAN CLOSE</button>
+      <button id="btnSC" class="red" data-key="safety_stop_closing_active">STOP CLOSING</button>
+      <button id="btnSO" class="red" data-key="safety_stop_opening_active">STOP OPENING</button>
+      <button id="btnDMO" class="lightgreen" data-key="deadman_open_active">DEADMAN OPEN</button>
+      <button id="btnDMC" class="lightblue" data-key="deadman_close_active">DEADMAN CLOSE</button>
     </div>
 
     <div class="row small">
-      <button id="btnTimed" class="purple" onclick="toggle('timed_open_active')">TIMED OPEN</button>
+      <button id="btnTimed" class="purple" data-key="timed_open_active">TIMED OPEN</button>
       <button class="cyan" onclick="pulse()">STEP LOGIC</button>
     </div>
 
@@ -330,7 +353,35 @@ INDEX = """<!doctype html><meta charset="utf-8">
 
 <script>
 async function fetchJSON(u,opts){const r=await fetch(u,opts); if(!r.ok) throw new Error(await r.text()); return r.json();}
-function setBtn(id,on){const el=document.getElementById(id); if(!el) return; on?el.classList.add('on'):el.classList.remove('on');}
+
+// Status flag -> [element, class]. Elements are looked up once and only
+// flags that changed since the last status touch the DOM.
+const FLAG_ELS = Object.entries({
+  cmd_open_active: ['btnOpen', 'on'],
+  cmd_stop_active: ['btnStop', 'on'],
+  cmd_close_active: ['btnClose', 'on'],
+  photocell_closing_active: ['btnPClose', 'on'],
+  photocell_opening_active: ['btnPOpen', 'on'],
+  partial_1_active: ['btnPO1', 'on'],
+  partial_2_active: ['btnPO2', 'on'],
+  safety_stop_closing_active: ['btnSC', 'on'],
+  safety_stop_opening_active: ['btnSO', 'on'],
+  deadman_open_active: ['btnDMO', 'on'],
+  deadman_close_active: ['btnDMC', 'on'],
+  timed_open_active: ['btnTimed', 'on'],
+  // Limit switch indicators on learning page
+  open_limit_m1_active: ['lsM1Open', 'active'],
+  close_limit_m1_active: ['lsM1Close', 'active'],
+  open_limit_m2_active: ['lsM2Open', 'active'],
+  close_limit_m2_active: ['lsM2Close', 'active'],
+}).map(([key, [id, cls]]) => [key, document.getElementById(id), cls]).filter(([, el]) => el);
+const prevFlags = {};
+function applyFlags(flags){
+  for (const [key, el, cls] of FLAG_ELS){
+    const on = Boolean(flags[key]);
+    if (prevFlags[key] !== on){ el.classList.toggle(cls, on); prevFlags[key] = on; }
+  }
+}
 
 // Page navigation
 function showPage(page) {
@@ -347,30 +398,30 @@ function showPage(page) {
 }
 
 // Control page
-async function refresh(){
-  try{
-    const s = await fetchJSON('/api/status');
+function render(s){
     document.getElementById('status').textContent =
       `${s.state} | M1 ${s.m1_percent}% (spd ${s.m1_speed}%)  M2 ${s.m2_percent}% (spd ${s.m2_speed}%)`+
       (s.auto_close_active?` | Auto-close ${s.auto_close_countdown}s`:
         s.partial_1_auto_close_active?` | PO1 ${s.partial_1_auto_close_countdown}s`:
         s.partial_2_auto_close_active?` | PO2 ${s.partial_2_auto_close_countdown}s`:'');
-    setBtn('btnOpen',  s.flags.cmd_open_active);
-    setBtn('btnStop',  s.flags.cmd_stop_active);
-    setBtn('btnClose', s.flags.cmd_close_active);
-    setBtn('btnPClose', s.flags.photocell_closing_active);
-    setBtn('btnPOpen',  s.flags.photocell_opening_active);
-    setBtn('btnPO1',    s.flags.partial_1_active);
-    setBtn('btnPO2',    s.flags.partial_2_active);
-    setBtn('btnSC', s.flags.safety_stop_closing_active);
-    setBtn('btnSO', s.flags.safety_stop_opening_active);
-    setBtn('btnDMO', s.flags.deadman_open_active);
-    setBtn('btnDMC', s.flags.deadman_close_active);
-    setBtn('btnTimed', s.flags.timed_open_active);
-
-    // Update limit switch indicators on learning page
-    updateLimitIndicators(s.flags);
-  }catch(e){/* no-op */}
+    applyFlags(s.flags);
+}
+
+// Coalesce status updates to one render per animation frame - a burst of
+// pushes paints only the newest, and a hidden tab paints nothing
+let pendingStatus = null;
+function scheduleRender(s){
+  const idle = pendingStatus === null;
+  pendingStatus = s;
+  if (idle) requestAnimationFrame(() => {
+    const p = pendingStatus;
+    pendingStatus = null;
+    render(p);
+  });
+}
+
+async function refresh(){
+  try{ scheduleRender(await fetchJSON('/api/status')); }catch(e){/* no-op */}
 }
 
 async function toggle(key){
@@ -378,6 +429,11 @@ async function toggle(key){
     body: JSON.stringify({key})});
   refresh();
 }
+// One delegated listener for every data-key toggle button
+document.querySelector('main').addEventListener('click', e => {
+  const b = e.target.closest('button[data-key]');
+  if (b) toggle(b.dataset.key);
+});
 async function pulse(){
   await fetchJSON('/api/pulse',{method:'POST'});
 }
@@ -599,181 +655,360 @@ async function saveLearnedTimes(){
   loadLearningPage();
 }
 
-function updateLimitIndicators(flags){
-  const indicators = {
-    'lsM1Open': 'open_limit_m1_active',
-    'lsM1Close': 'close_limit_m1_active',
-    'lsM2Open': 'open_limit_m2_active',
-    'lsM2Close': 'close_limit_m2_active'
-  };
-  for (const [id, key] of Object.entries(indicators)) {
-    const el = document.getElementById(id);
-    if (el) {
-      if (flags[key]) el.classList.add('active');
-      else el.classList.remove('active');
-    }
-  }
-}
-
-// WebSocket log
+// WebSocket - status pushed on change (text frames) plus a binary log record
 const logEl = document.getElementById('log');
-let ws;
+const utf8 = new TextDecoder();
+const pad2 = n => String(n).padStart(2, '0');
+function logLine(r){
+  const d = new Date(r.t * 1000);
+  return `${pad2(d.getHours())}:${pad2(d.getMinutes())}:${pad2(d.getSeconds())} | ${r.state} | `+
+    `M1 ${r.m1p}% spd ${r.m1s}% | M2 ${r.m2p}% spd ${r.m2s}%`;
+}
+let ws, pollTimer = null;
 function openWS(){
   const proto = location.protocol==='https:'?'wss':'ws';
   ws = new WebSocket(`${proto}://${location.host}/ws`);
-  ws.onmessage = e => { logEl.textContent = e.data + "\\n" + logEl.textContent; };
-  ws.onclose = ()=>{ setTimeout(openWS, 1500); };
+  ws.binaryType = 'arraybuffer';
+  ws.onopen = ()=>{ if(pollTimer){ clearInterval(pollTimer); pollTimer = null; } };
+  ws.onmessage = e => {
+    if (typeof e.data === 'string') { scheduleRender(JSON.parse(e.data)); return; }
+    logEl.textContent = logLine(JSON.parse(utf8.decode(e.data))) + "\\n" + logEl.textContent;
+  };
+  ws.onclose = ()=>{
+    // Poll until the socket is back
+    if(!pollTimer) pollTimer = setInterval(refresh, 500);
+    setTimeout(openWS, 1500);
+  };
 }
 openWS();
 loadCfg();
-setInterval(refresh, 500);
+refresh();
 </script>
 """
 
+def json_bytes(data):
+    """Serialize to compact JSON bytes - orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+def json_loads(body):
+    """Parse a JSON request body - orjson when available"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+OK_BODY = b'{"ok":true}'
+
+def ok_response():
+    """Fixed {"ok": true} reply from precomputed bytes"""
+    return Response(OK_BODY, media_type="application/json")
+
+def json_response(data, status_code=200):
+    """JSON response from pre-serialized bytes (skips FastAPI's jsonable_encoder)"""
+    return Response(json_bytes(data), media_type="application/json", status_code=status_code)
+
+def make_etag(body):
+    """Strong ETag for a response body"""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+def etag_response(req, body, etag=None):
+    """JSON response with ETag - 304 with no body if the client already has it.
+    no-cache makes the browser revalidate every poll instead of reusing a
+    heuristically cached copy"""
+    etag = etag or make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if req.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+# INDEX never changes at runtime - encode, compress and tag it once.
+# Each encoding gets its own ETag since the bytes differ.
+INDEX_BYTES = INDEX.encode("utf-8")
+_index_etag = make_etag(INDEX_BYTES)
+INDEX_VARIANTS = {None: (INDEX_BYTES, _index_etag),
+                  "gzip": (gzip.compress(INDEX_BYTES, 9), _index_etag[:-1] + '-gz"')}
+if brotli is not None:
+    INDEX_VARIANTS["br"] = (brotli.compress(INDEX_BYTES, quality=11), _index_etag[:-1] + '-br"')
+
 @app.get("/", response_class=HTMLResponse)
-def index(): return HTMLResponse(INDEX)
+def index(req: Request):
+    accept = req.headers.get("accept-encoding", "")
+    encoding = "br" if "br" in accept and "br" in INDEX_VARIANTS else "gzip" if "gzip" in accept else None
+    body, etag = INDEX_VARIANTS[encoding]
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if req.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="text/html; charset=utf-8", headers=headers)
+
+# Input/command flags reported with every status
+FLAG_KEYS = (
+    'cmd_open_active', 'cmd_stop_active', 'cmd_close_active',
+    'photocell_closing_active', 'photocell_opening_active',
+    'partial_1_active', 'partial_2_active',
+    'safety_stop_closing_active', 'safety_stop_opening_active',
+    'deadman_open_active', 'deadman_close_active', 'timed_open_active',
+    'open_limit_m1_active', 'close_limit_m1_active',
+    'open_limit_m2_active', 'close_limit_m2_active',
+)
+# Status values coerced to ints for display
+NUM_KEYS = ('m1_percent', 'm2_percent', 'm1_speed', 'm2_speed', 'auto_close_countdown',
+            'partial_1_auto_close_countdown', 'partial_2_auto_close_countdown')
+
+# Raw shared keys behind the status - the /ws change check compares these
+WATCH_KEYS = ('state', 'm1_position', 'm2_position', 'm1_speed', 'm2_speed',
+              'auto_close_active', 'auto_close_countdown',
+              'partial_1_auto_close_active', 'partial_1_auto_close_countdown',
+              'partial_2_auto_close_active', 'partial_2_auto_close_countdown') + FLAG_KEYS
+
+def status_key(snap):
+    """Cheap change key - the watched snapshot fields plus the telemetry slot
+    and the run times the percentages are scaled by"""
+    return ((controller.motor_telemetry.read(), controller.motor1_run_time,
+             controller.motor2_run_time) + tuple(snap.get(k) for k in WATCH_KEYS))
+
+def build_status(snap=None):
+    """Status + input flags - shared by /api/status and the /ws push"""
+    # Fields and flags from one dict copy - a proxy read is a round trip each
+    if snap is None:
+        snap = controller.shared.copy()
+    s = controller.get_status(snap)
+    g = snap.get
+    s['flags'] = {k: g(k, False) for k in FLAG_KEYS}
+    # coerce numbers to simple ints for display
+    for k in NUM_KEYS:
+        v = s.get(k)
+        if v is not None:
+            s[k] = int(v)
+    return s
+
+# Last /api/status (built at, body, ETag) - tabs polling within STATUS_TTL
+# share one build. Kept as one tuple so body and ETag always match; the lock
+# keeps threadpool requests to a single rebuild
+STATUS_TTL = 0.1
+_st_cache = (-STATUS_TTL, b"", None)
+_st_lock = threading.Lock()
+# status_key -> (body, ETag) for recently seen raw states - an idle or
+# parked gate keeps hitting the same few entries and skips serialization.
+# Locked: threadpool requests share the LRU
+STATUS_CACHE_SIZE = 64
+_st_bodies = OrderedDict()
+_st_bodies_lock = threading.Lock()
+
+def status_body():
+    """Serialized status + ETag, built only for a raw state not seen recently"""
+    snap = controller.shared.copy()
+    key = status_key(snap)
+    with _st_bodies_lock:
+        hit = _st_bodies.get(key)
+        if hit is not None:
+            _st_bodies.move_to_end(key)
+            return hit
+    body = json_bytes(build_status(snap))
+    hit = (body, make_etag(body))
+    with _st_bodies_lock:
+        _st_bodies[key] = hit
+        if len(_st_bodies) > STATUS_CACHE_SIZE:
+            _st_bodies.popitem(last=False)
+    return hit
 
 @app.get("/api/status")
-def status():
-    s = controller.get_status()
-    flags = {
-        'cmd_open_active': controller.shared.get('cmd_open_active', False),
-        'cmd_stop_active': controller.shared.get('cmd_stop_active', False),
-        'cmd_close_active': controller.shared.get('cmd_close_active', False),
-        'photocell_closing_active': controller.shared.get('photocell_closing_active', False),
-        'photocell_opening_active': controller.shared.get('photocell_opening_active', False),
-        'partial_1_active': controller.shared.get('partial_1_active', False),
-        'partial_2_active': controller.shared.get('partial_2_active', False),
-        'safety_stop_closing_active': controller.shared.get('safety_stop_closing_active', False),
-        'safety_stop_opening_active': controller.shared.get('safety_stop_opening_active', False),
-        'deadman_open_active': controller.shared.get('deadman_open_active', False),
-        'deadman_close_active': controller.shared.get('deadman_close_active', False),
-        'timed_open_active': controller.shared.get('timed_open_active', False),
-        'open_limit_m1_active': controller.shared.get('open_limit_m1_active', False),
-        'close_limit_m1_active': controller.shared.get('close_limit_m1_active', False),
-        'open_limit_m2_active': controller.shared.get('open_limit_m2_active', False),
-        'close_limit_m2_active': controller.shared.get('close_limit_m2_active', False),
-    }
-    s['flags'] = flags
-    # coerce numbers to simple ints for display
-    for k in ['m1_percent','m2_percent','m1_speed','m2_speed','auto_close_countdown',
-              'partial_1_auto_close_countdown','partial_2_auto_close_countdown']:
-        if k in s and s[k] is not None:
-            s[k] = int(s[k])
-    return JSONResponse(s)
+def status(req: Request):
+    global _st_cache
+    with _st_lock:
+        now = time.monotonic()
+        if now - _st_cache[0] >= STATUS_TTL:
+            _st_cache = (now,) + status_body()
+        _, body, etag = _st_cache
+    return etag_response(req, body, etag)
 
 @app.post("/api/toggle")
 async def toggle(req: Request):
-    data = await req.json()
+    data = json_loads(await req.body())
     key = data.get("key")
-    # if STOP is toggled, make it "sustained" like Tk loop
-    if key == 'cmd_stop_active':
-        controller.shared['cmd_stop_active'] = not controller.shared.get('cmd_stop_active', False)
-    else:
-        controller.shared[key] = not controller.shared.get(key, False)
-    return JSONResponse({"ok": True, "key": key, "value": controller.shared[key]})
+    # STOP included - a toggle is "sustained" like the Tk loop for every key
+    value = controller.toggle_flag(key)
+    return json_response({"ok": True, "key": key, "value": value})
 
 @app.post("/api/pulse")
 def pulse():
     controller.shared['step_logic_pulse'] = True
-    return {"ok": True}
-
-@app.get("/api/config")
-def get_config():
+    return ok_response()
+
+# Serialized gate_config.json, rebuilt only when the file's mtime changes
+# path -> (mtime_ns, JSON bytes, parsed object, ETag) for the JSON files the
+# UI reads; an entry is re-read only when the file's mtime moves
+_file_cache = {}
+
+def _json_file(path):
+    """Return (file bytes, parsed object, ETag) for path, parsing only on change.
+    The bytes are served as-is - no re-serialization of the parsed copy"""
+    mtime = path.stat().st_mtime_ns
+    hit = _file_cache.get(path)
+    if hit is None or hit[0] != mtime:
+        body = path.read_bytes()
+        hit = _file_cache[path] = (mtime, body, json_loads(body), make_etag(body))
+    return hit[1:]
+
+def _config_body():
+    """Return gate_config.json as (JSON bytes, ETag), re-reading only when it changed"""
     try:
-        return JSONResponse(json.loads(CFG.read_text()))
+        body, _, etag = _json_file(CFG)
+        return body, etag
     except Exception:
-        return JSONResponse({}, status_code=200)
+        return b"{}", None
+
+def _write_json(path, cfg):
+    """Temp file + rename so a reader never sees a half-written config"""
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(cfg, indent=2))
+    tmp.replace(path)
+
+@app.get("/api/config")
+def get_config(req: Request):
+    body, etag = _config_body()
+    return etag_response(req, body, etag)
 
 @app.post("/api/config")
 async def set_config(req: Request):
     try:
+        cfg = json_loads(await req.body())
+        # Unchanged save (UI autosave) - no stop, no write, no reload
+        try:
+            unchanged = cfg == _json_file(CFG)[1]
+        except Exception:
+            unchanged = False
+        if unchanged:
+            return ok_response()
         # stop before writing, match Tk behaviour
         controller.shared['cmd_stop_active'] = True
         controller.shared['cmd_open_active'] = False
         controller.shared['cmd_close_active'] = False
-        cfg = await req.json()
-        CFG.write_text(json.dumps(cfg, indent=2))
-        controller.reload_config()
-        return {"ok": True}
+        # File write and controller reload in a worker thread so /ws
+        # broadcasts keep running on time during a save
+        await asyncio.to_thread(_write_json, CFG, cfg)
+        _file_cache.pop(CFG, None)  # mtime granularity can hide a fast rewrite
+        await asyncio.to_thread(controller.reload_config)
+        return ok_response()
     except Exception as e:
-        return JSONResponse({"ok": False, "error": str(e)}, status_code=500)
+        return json_response({"ok": False, "error": str(e)}, status_code=500)
 
 @app.post("/api/reload")
 def reload_cfg():
     ok = controller.reload_config()
     return {"ok": bool(ok)}
 
-@app.get("/api/inputs")
-def get_inputs():
-    """Get all input states with voltage/resistance data"""
-    try:
-        print(f"Reading input config from: {INPUT_CFG}")
-        with open(INPUT_CFG, 'r') as f:
-            input_config = json.load(f)
-
-        inputs = {}
-        for name, cfg in input_config.get('inputs', {}).items():
-            state_key = f'{name}_state'
-            voltage_key = f'{name}_voltage'
-            resistance_key = f'{name}_resistance'
-
-            # Debug: print what keys are in shared memory
-            if len(inputs) == 0:  # Only print once
-                print(f"Sample keys in controller.shared: {list(controller.shared.keys())[:10]}")
-
-            # Get resistance and handle inf/nan values (not JSON compliant)
-            resistance = controller.shared.get(resistance_key, None)
-            if resistance is not None:
-                import math
-                if math.isinf(resistance) or math.isnan(resistance):
-                    resistance = None  # Convert inf/nan to null for JSON
-
-            inputs[name] = {
+# Static per-input fields and shared-dict key names from input_config.json,
+# rebuilt when the parsed config object changes; requests only overlay the
+# live readings
+_inputs_static = {"src": None, "inputs": {}}
+
+def _static_inputs():
+    _, input_config, _ = _json_file(INPUT_CFG)
+    if _inputs_static["src"] is not input_config:
+        _inputs_static["inputs"] = {
+            name: ({
                 'channel': cfg['channel'],
                 'type': cfg.get('type', 'NO'),
                 'function': cfg.get('function'),
                 'description': cfg.get('description', ''),
-                'state': controller.shared.get(state_key, False),
-                'voltage': controller.shared.get(voltage_key, 0.0),
-                'resistance': resistance,
-            }
-        print(f"Returning {len(inputs)} inputs")
-        return JSONResponse(inputs)
+            }, sys.intern(f'{name}_state'), sys.intern(f'{name}_voltage'),
+                sys.intern(f'{name}_resistance'))
+            for name, cfg in input_config.get('inputs', {}).items()
+        }
+        _inputs_static["src"] = input_config
+    return _inputs_static["inputs"]
+
+# Last /api/inputs (built at, body, ETag) - concurrent or back-to-back
+# requests within INPUTS_TTL share one build. One tuple so body and ETag
+# always match; the lock keeps a burst to a single build
+INPUTS_TTL = 0.1
+_inputs_cache = (-INPUTS_TTL, b"", None)
+_inputs_lock = threading.Lock()
+
+@app.get("/api/inputs")
+def get_inputs(req: Request):
+    """Get all input states with voltage/resistance data"""
+    global _inputs_cache
+    try:
+        with _inputs_lock:
+            now = time.monotonic()
+            if now - _inputs_cache[0] >= INPUTS_TTL:
+                body = _build_inputs()
+                _inputs_cache = (now, body, make_etag(body))
+            _, body, etag = _inputs_cache
     except Exception as e:
-        import traceback
+        # errors are returned, never cached
         print(f"ERROR in /api/inputs: {e}")
         print(traceback.format_exc())
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return json_response({"error": str(e)}, status_code=500)
+    return etag_response(req, body, etag)
+
+def _build_inputs():
+    """Encoded input states - static config fields plus live readings"""
+    static = _static_inputs()
+    # One dict copy instead of three proxy round trips per input
+    get = controller.shared.copy().get
+    inputs = {}
+    for name, (fields, state_key, voltage_key, resistance_key) in static.items():
+        # Get resistance and handle inf/nan values (not JSON compliant)
+        resistance = get(resistance_key)
+        if resistance is not None and not isfinite(resistance):
+            resistance = None  # Convert inf/nan to null for JSON
+
+        inputs[name] = {
+            **fields,
+            'state': get(state_key, False),
+            'voltage': get(voltage_key, 0.0),
+            'resistance': resistance,
+        }
+    return json_bytes(inputs)
 
 @app.get("/api/input_config")
-def get_input_config():
+def get_input_config(req: Request):
     """Get input configuration"""
     try:
-        return JSONResponse(json.loads(INPUT_CFG.read_text()))
-    except Exception:
-        return JSONResponse({"inputs": {}}, status_code=200)
+        body, _, etag = _json_file(INPUT_CFG)
+        return etag_response(req, body, etag)
+    except FileNotFoundError:
+        return json_response({"inputs": {}})
+    except ValueError as e:
+        # Covers json and orjson decode errors - a corrupt file, not a missing one
+        print(f"ERROR in /api/input_config: bad {INPUT_CFG}: {e}")
+        return json_response({"inputs": {}})
 
 @app.post("/api/input_config")
 async def set_input_config(req: Request):
     """Save input configuration"""
     try:
-        cfg = await req.json()
-        INPUT_CFG.write_text(json.dumps(cfg, indent=2))
-        return {"ok": True}
+        cfg = json_loads(await req.body())
+        # Same atomic, off-loop write as the gate config
+        await asyncio.to_thread(_write_json, INPUT_CFG, cfg)
+        _file_cache.pop(INPUT_CFG, None)
+        return ok_response()
     except Exception as e:
-        return JSONResponse({"ok": False, "error": str(e)}, status_code=500)
+        return json_response({"ok": False, "error": str(e)}, status_code=500)
+
+# Learned times only move after a learning run - the encoded body is reused
+# until the values themselves differ. One (key, body, ETag) tuple so body and
+# ETag always come from the same build
+_learned_cache = (None, b"", None)
 
 @app.get("/api/learned_times")
-def get_learned_times():
+def get_learned_times(req: Request):
     """Get learned travel times"""
+    global _learned_cache
     status = controller.get_learning_status()
-    return JSONResponse({
-        'm1_open': status.get('m1_open_time'),
-        'm1_close': status.get('m1_close_time'),
-        'm2_open': status.get('m2_open_time'),
-        'm2_close': status.get('m2_close_time'),
-    })
+    key = (status.get('m1_open_time'), status.get('m1_close_time'),
+           status.get('m2_open_time'), status.get('m2_close_time'))
+    cached = _learned_cache
+    if key != cached[0]:
+        body = json_bytes(dict(zip(('m1_open', 'm1_close', 'm2_open', 'm2_close'), key)))
+        cached = _learned_cache = (key, body, make_etag(body))
+    _, body, etag = cached
+    return etag_response(req, body, etag)
 
 @app.post("/api/save_learned_times")
 def save_learned_times():
@@ -784,15 +1019,16 @@ def save_learned_times():
 @app.post("/api/engineer_mode")
 async def set_engineer_mode(req: Request):
     """Toggle engineer mode"""
-    data = await req.json()
+    data = json_loads(await req.body())
     enabled = data.get('enabled', False)
     controller.shared['engineer_mode_enabled'] = enabled
+    controller.wake_motor()
     return {"ok": True, "enabled": enabled}
 
 @app.post("/api/learning_mode")
 async def set_learning_mode(req: Request):
     """Toggle learning mode"""
-    data = await req.json()
+    data = json_loads(await req.body())
     enabled = data.get('enabled', False)
     if enabled:
         controller.enable_learning_mode()
@@ -812,26 +1048,99 @@ def stop_auto_learn():
     controller.stop_auto_learn()
     return {"ok": True}
 
+# Connected /ws clients -> their bounded send queue; one broadcaster feeds them all
+_CLIENTS = {}
+WS_QUEUE_SIZE = 8
+
+def _publish(msg):
+    """Queue a frame for every client - a full queue drops its oldest frame"""
+    for q in _CLIENTS.values():
+        try:
+            q.put_nowait(msg)
+        except asyncio.QueueFull:
+            # Slow client - lose the stale frame rather than grow without bound
+            q.get_nowait()
+            q.put_nowait(msg)
+
+async def _ws_writer(ws, q):
+    """Drain one client's queue - str frames go as text, bytes as binary"""
+    while True:
+        msg = await q.get()
+        if isinstance(msg, str):
+            await ws.send_text(msg)
+        else:
+            await ws.send_bytes(msg)
+
+def _status_if_changed(last_key):
+    """Blocking half of a broadcast tick - proxy snapshot, then a status
+    build only when the raw fields moved. Returns (key, status or None)"""
+    snap = controller.shared.copy()
+    key = status_key(snap)
+    if key == last_key:
+        return key, None
+    return key, build_status(snap)
+
+async def _broadcaster():
+    """Build the status once per tick and push the same bytes to every client"""
+    last_key = None
+    last_body = None
+    s = None
+    last_log = 0.0
+    while True:
+        try:
+            if _CLIENTS:
+                # Rebuild the status only when the raw fields moved - an idle
+                # gate costs one dict copy per tick and sends nothing. The
+                # Manager IPC runs in a worker thread, off the event loop
+                last_key, status = await asyncio.to_thread(_status_if_changed, last_key)
+                if status is not None:
+                    s = status
+                    body = json_bytes(s)
+                    if body != last_body:
+                        _publish(body.decode())
+                        last_body = body
+                now = time.time()
+                if s is not None and now - last_log >= 1.0:
+                    # Log record as binary JSON - the browser formats the line
+                    _publish(json_bytes({
+                        "t": int(now), "state": s['state'],
+                        "m1p": s['m1_percent'], "m1s": s['m1_speed'],
+                        "m2p": s['m2_percent'], "m2s": s['m2_speed'],
+                    }))
+                    last_log = now
+        except Exception as e:
+            print(f"WS broadcast error: {e}")
+        await asyncio.sleep(0.1)
+
 @app.websocket("/ws")
 async def ws(ws: WebSocket):
     await ws.accept()
+    q = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+    # Current status straight away - the broadcaster only sends changes
+    status = await asyncio.to_thread(build_status)
+    q.put_nowait(json_bytes(status).decode())
+    writer = asyncio.create_task(_ws_writer(ws, q))
+    _CLIENTS[ws] = q
     try:
-        while True:
-            s = controller.get_status()
-            msg = f"{time.strftime('%H:%M:%S')} | {s['state']} | M1 {s['m1_percent']:.0f}% spd {s['m1_speed']:.0f}% | M2 {s['m2_percent']:.0f}% spd {s['m2_speed']:.0f}%"
-            await ws.send_text(msg)
-            await asyncio.sleep(1.0)
+        # Nothing to read from the browser - just wait for the disconnect
+        while (await ws.receive())["type"] != "websocket.disconnect":
+            pass
     except Exception:
         # Connection closed by client - don't try to close again
         pass
+    finally:
+        _CLIENTS.pop(ws, None)
+        writer.cancel()
 
 if __name__ == "__main__":
-    import threading
     from gate_ui import GateUI
 
     # Start web server in background thread
     def run_web_server():
-        uvicorn.run(app, host="0.0.0.0", port=8000)
+        # "auto" picks uvloop and httptools when installed (see requirements.txt)
+        # and falls back to asyncio/h11. No per-request access log lines.
+        uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto",
+                    access_log=False)
 
     web_thread = threading.Thread(target=run_web_server, daemon=True)
     web_thread.start()